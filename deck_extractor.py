@@ -0,0 +1,87 @@
+from typing import List, Dict
+
+import io
+import os
+
+from pptx import Presentation
+
+from extraction_engine import ExtractionEngine
+from deep_scanner import DeepScanner
+from ppt_converter import PPTConverter, is_legacy_ppt
+
+# GUI 없이 덱 하나에서 태깅 레코드 추출 (PPTDataExtractor와 같은 순서/규칙)
+# 배치 병합, 격리 워커, 파이프라인 등에서 공용으로 사용
+
+
+def _no_log(message, msg_type="info"):
+    pass
+
+
+def load_presentation(path, log=_no_log, converter=None, data=None):
+    #.ppt는 .pptx로 변환 후 로드 - (presentation, 실제 로드 경로) 반환
+    #data: 이미 읽어 둔 .pptx 파일 내용 (파이프라인 읽기 단계에서 전달, 디스크를 다시 읽지 않음)#
+    load_path = path
+    if is_legacy_ppt(path):
+        log(".ppt 파일을 .pptx로 변환 중...", "info")
+        load_path = (converter or PPTConverter()).ensure_pptx(path)
+        data = None
+    presentation = Presentation(io.BytesIO(data) if data is not None else load_path)
+    log(f"PPT 파일 로드 완료. 총 {len(presentation.slides)}개 슬라이드", "info")
+    return presentation, load_path
+
+
+def extract_deep_records(presentation, engine=None, log=_no_log) -> List[Dict]:
+    #태깅 테이블로 처리되지 않은 곳(그룹 도형, 텍스트 상자, 기타 테이블, 노트)의 태깅 데이터 추출
+    #engine: extract()를 마친 엔진이면 그 엔진이 처리한 테이블만 제외, 없으면 최상위 테이블 모두 제외#
+    handled_tables = engine.handled_tables if engine is not None else None
+    try:
+        hits = DeepScanner().scan_presentation(presentation, handled_tables)
+    except Exception as e:
+        log(f"그룹/노트 태깅 검색 오류: {str(e)}", "warning")
+        return []
+
+    if hits:
+        # 제목은 테이블 추출과 같은 규칙으로 (슬라이드당 한 번)
+        engine = engine or ExtractionEngine()
+        slides = presentation.slides
+        titles = {}
+        for hit in hits:
+            slide_num = hit['Slide']
+            if slide_num not in titles:
+                titles[slide_num] = engine.slide_title(slides[slide_num - 1], slide_num)
+            hit['Title'] = titles[slide_num]
+
+        sources = {}
+        for hit in hits:
+            sources[hit['Source']] = sources.get(hit['Source'], 0) + 1
+        summary = ", ".join(f"{source} {count}개" for source, count in sources.items())
+        log(f"테이블 외 태깅 데이터 {len(hits)}개 추출 ({summary})", "success")
+
+    return hits
+
+
+def extract_presentation(presentation, log=_no_log, progress=None, deep=True, eta=None) -> List[Dict]:
+    engine = ExtractionEngine(log=log, progress=progress, eta=eta)
+    records = engine.extract(presentation)
+    if deep:
+        records.extend(extract_deep_records(presentation, engine, log))
+    return records
+
+
+def extract_deck(path, log=_no_log, progress=None, deep=True, converter=None, data=None, eta=None) -> List[Dict]:
+    #파일 경로 (또는 미리 읽은 내용) -> 태깅 레코드 목록#
+    presentation, _ = load_presentation(path, log, converter, data)
+    return extract_presentation(presentation, log, progress, deep, eta)
+
+
+def collect_decks(paths, extensions=('.pptx',)) -> List[str]:
+    #파일/폴더 목록 -> 덱 파일 목록 (폴더는 하위까지, Office 임시 파일 제외)#
+    decks = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                decks.extend(os.path.join(root, name) for name in sorted(files)
+                             if name.lower().endswith(extensions) and not name.startswith('~$'))
+        else:
+            decks.append(path)
+    return decks
@@ -0,0 +1,262 @@
+from typing import List, Dict, Optional, Callable
+
+import os
+import sys
+import time
+import queue
+import argparse
+import threading
+
+from isolated_runner import (IsolatedPool, DeckResult, DEFAULT_TIMEOUT, DEFAULT_MEMORY_MB,
+                             DEFAULT_MAX_UNCOMPRESSED_MB, STATUS_ERROR, STATUS_CRASHED)
+from ppt_converter import PPTConverter, convert_decks, is_legacy_ppt
+
+# 여러 덱을 단계별로 겹쳐서 처리하는 파이프라인
+#   (시작 전) .ppt는 모두 모아서 PPTConverter.convert_batch 한 번으로 변환 (soffice 기동 최소화)
+#   read  (스레드 1개)   : 다음 덱 파일 내용을 미리 읽음
+#   parse (격리 워커 N개): 읽어 둔 내용으로 태깅 레코드 추출 (IsolatedPool 워커, 시간/메모리 한도)
+#   write (스레드 1개)   : 이전 덱 결과를 출력 (기본: 덱별 태깅 워크북)
+# - 단계 사이는 크기가 제한된 큐 (앞 단계가 너무 앞서가면 대기 -> 메모리 사용량 제한)
+# - 단계별 사용률(작업 시간 / 전체 시간)을 보고하여 워커 수/큐 크기 조정에 사용
+# - 단계 스레드는 예외로 멈추지 않음 (멈추면 앞 단계가 큐에서 막혀 run()이 끝나지 않음)
+#   on_result 콜백 오류는 모든 덱을 처리한 뒤 run()에서 다시 발생
+#
+#   python deck_pipeline.py <pptx 파일 또는 폴더> [...] [-o 출력 폴더] [--workers 2] [--queue-size 2]
+
+_DONE = object()
+
+
+class StageStats:
+    #단계 하나의 처리 수/작업 시간/대기 시간 (lanes: 동시에 일하는 스레드/워커 수)#
+
+    def __init__(self, name, lanes=1):
+        self.name = name
+        self.lanes = lanes
+        self.items = 0
+        self.busy = 0.0
+        self.waiting = 0.0
+        self.nbytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, busy, waiting=0.0, nbytes=0):
+        with self._lock:
+            self.items += 1
+            self.busy += busy
+            self.waiting += waiting
+            self.nbytes += nbytes
+
+    def utilization(self, wall) -> float:
+        return self.busy / (wall * self.lanes) if wall > 0 else 0.0
+
+    def as_dict(self, wall) -> Dict:
+        return {
+            'stage': self.name,
+            'lanes': self.lanes,
+            'items': self.items,
+            'busy_seconds': round(self.busy, 3),
+            'wait_seconds': round(self.waiting, 3),
+            'utilization': round(self.utilization(wall), 3),
+            'bytes': self.nbytes,
+        }
+
+
+def default_output_path(path, output_dir=None) -> str:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(output_dir or os.path.dirname(path), f"{stem}_tagging.xlsx")
+
+
+def workbook_writer(output_dir=None) -> Callable[[DeckResult], str]:
+    #덱별 태깅 워크북(+ 검증 리포트)을 쓰는 기본 writer#
+    from tag_workbook import write_tagging_workbook
+
+    def write(result: DeckResult) -> str:
+        output = default_output_path(result.path, output_dir)
+        write_tagging_workbook(output, result.records)
+        return output
+
+    return write
+
+
+class DeckPipeline:
+    def __init__(self, workers=2, queue_size=2, writer: Optional[Callable[[DeckResult], Optional[str]]] = None,
+                 deep=True, timeout=DEFAULT_TIMEOUT, memory_mb=DEFAULT_MEMORY_MB,
+                 max_uncompressed_mb=DEFAULT_MAX_UNCOMPRESSED_MB, converter: Optional[PPTConverter] = None):
+        # writer: 추출에 성공한 덱마다 write 스레드에서 호출 (반환값은 출력 파일 경로)
+        # converter: .ppt 일괄 변환기 (없으면 .ppt가 있을 때 기본 설정으로 생성)
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.writer = writer if writer is not None else workbook_writer()
+        self.deep = deep
+        self.converter = converter
+        self.pool = IsolatedPool(self.workers, timeout, memory_mb, max_uncompressed_mb)
+        self.stats = {}
+        self.wall = 0.0
+        self._callback_error = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.pool.close()
+
+    # ---- 단계 ----
+
+    def _read(self, jobs, parse_queue, stats):
+        try:
+            for idx, path, load_path in jobs:
+                start = time.perf_counter()
+                data = None
+                if not is_legacy_ppt(load_path):
+                    try:
+                        with open(load_path, 'rb') as f:
+                            data = f.read()
+                    except OSError:
+                        data = None  # 워커가 직접 열어서 오류를 보고
+                busy = time.perf_counter() - start
+                parse_queue.put((idx, path, load_path, data))
+                stats.add(busy, time.perf_counter() - start - busy, len(data) if data else 0)
+        finally:
+            for _ in range(self.workers):
+                parse_queue.put(_DONE)
+
+    def _parse(self, worker, parse_queue, write_queue, stats):
+        while True:
+            start = time.perf_counter()
+            job = parse_queue.get()
+            if job is _DONE:
+                return
+            idx, path, load_path, data = job
+            got = time.perf_counter()
+            try:
+                result = worker.run(load_path, self.pool.timeout, self.deep, data=data)
+                result.path = path  # 변환된 .pptx가 아니라 원본 경로로 보고
+            except Exception as e:
+                worker.kill()
+                result = DeckResult(path, STATUS_CRASHED, message=f"워커 실행 오류: {e}")
+            job = data = None
+            done = time.perf_counter()
+            write_queue.put((idx, result))
+            stats.add(done - got, (got - start) + (time.perf_counter() - done))
+
+    def _write(self, write_queue, results, stats, on_result):
+        while True:
+            start = time.perf_counter()
+            item = write_queue.get()
+            if item is _DONE:
+                return
+            idx, result = item
+            got = time.perf_counter()
+            if result.ok:
+                try:
+                    result.output = self.writer(result)
+                except Exception as e:
+                    result.status = STATUS_ERROR
+                    result.message = f"출력 저장 오류: {e}"
+            results[idx] = result
+            self._notify(on_result, result)
+            stats.add(time.perf_counter() - got, got - start)
+
+    def _notify(self, on_result, result):
+        #콜백 오류는 기록만 하고 계속 진행 (run() 끝에서 다시 발생)#
+        if not on_result:
+            return
+        try:
+            on_result(result)
+        except Exception as e:
+            if self._callback_error is None:
+                self._callback_error = e
+
+    # ---- 실행 ----
+
+    def run(self, paths, on_result: Optional[Callable[[DeckResult], None]] = None) -> List[DeckResult]:
+        #모든 덱 처리 - 입력 순서대로 결과 반환 (on_result는 write 스레드에서 완료 순서대로 호출)#
+        paths = list(paths)
+        results: List[Optional[DeckResult]] = [None] * len(paths)
+
+        self._callback_error = None
+        load_paths, failed = convert_decks(paths, self.converter)
+        jobs = []
+        for idx, path in enumerate(paths):
+            if path in failed:
+                results[idx] = DeckResult(path, STATUS_ERROR, message=failed[path])
+                self._notify(on_result, results[idx])
+            else:
+                jobs.append((idx, path, load_paths[path]))
+
+        parse_queue = queue.Queue(self.queue_size)
+        write_queue = queue.Queue(self.queue_size)
+
+        self.stats = {
+            'read': StageStats('read'),
+            'parse': StageStats('parse', self.workers),
+            'write': StageStats('write'),
+        }
+
+        start = time.perf_counter()
+        reader = threading.Thread(target=self._read, args=(jobs, parse_queue, self.stats['read']), daemon=True)
+        parsers = [threading.Thread(target=self._parse, args=(worker, parse_queue, write_queue, self.stats['parse']),
+                                    daemon=True)
+                   for worker in self.pool.workers]
+        writer = threading.Thread(target=self._write, args=(write_queue, results, self.stats['write'], on_result),
+                                  daemon=True)
+
+        for thread in [reader, writer] + parsers:
+            thread.start()
+        reader.join()
+        for thread in parsers:
+            thread.join()
+        write_queue.put(_DONE)
+        writer.join()
+        self.wall = time.perf_counter() - start
+        if self._callback_error is not None:
+            raise self._callback_error
+        return results
+
+    def utilization(self) -> List[Dict]:
+        return [stats.as_dict(self.wall) for stats in self.stats.values()]
+
+    def format_utilization(self) -> str:
+        lines = [f"전체 {self.wall:.2f}초"]
+        for row in self.utilization():
+            lines.append(
+                f"  {row['stage']:<5} x{row['lanes']}: {row['items']}건, 작업 {row['busy_seconds']:.2f}초, "
+                f"대기 {row['wait_seconds']:.2f}초, 사용률 {row['utilization'] * 100:.0f}%"
+            )
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    from deck_extractor import collect_decks
+
+    parser = argparse.ArgumentParser(description="여러 태깅 가이드를 읽기/추출/저장 단계를 겹쳐서 처리")
+    parser.add_argument('paths', nargs='+', help=".pptx/.ppt 파일 또는 폴더")
+    parser.add_argument('-o', '--output-dir', help="워크북 저장 폴더 (기본: 각 덱과 같은 폴더)")
+    parser.add_argument('--workers', type=int, default=2, help="추출 워커 프로세스 수")
+    parser.add_argument('--queue-size', type=int, default=2, help="단계 사이 큐 크기 (미리 읽어 둘 덱 수)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="덱당 처리 시간 한도(초)")
+    parser.add_argument('--memory-mb', type=int, default=DEFAULT_MEMORY_MB, help="워커당 메모리 한도(MB)")
+    parser.add_argument('--no-deep', action='store_true', help="그룹 도형/노트 검색 생략")
+    args = parser.parse_args(argv)
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    def on_result(result):
+        if result.ok:
+            print(f"[ok] {os.path.basename(result.path)}: {len(result.records)}개 -> {result.output}")
+        else:
+            print(f"[{result.status}] {os.path.basename(result.path)}: {result.message}")
+
+    decks = collect_decks(args.paths, ('.pptx', '.ppt'))
+    with DeckPipeline(args.workers, args.queue_size, workbook_writer(args.output_dir), not args.no_deep,
+                      args.timeout, args.memory_mb) as pipeline:
+        results = pipeline.run(decks, on_result)
+        print(pipeline.format_utilization())
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
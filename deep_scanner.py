@@ -0,0 +1,227 @@
+from typing import List, Dict
+
+import re
+
+from pptx_package import MappedPackage
+from tag_schema import default_schema
+
+# 슬라이드 XML 전체에서 태깅 속성 텍스트를 찾는 스캐너
+# python-pptx 도형 객체를 만들지 않고 lxml 요소를 직접 순회
+# - 이미 로드한 Presentation이 있으면 그 XML 트리를 재사용 (scan_presentation)
+# - 없으면 MappedPackage로 필요한 파트만 읽어서 파싱 (scan)
+# - 그룹 도형 안의 도형/테이블, 일반 텍스트 상자, 노트 슬라이드까지 검사
+# - 최상위 테이블은 ExtractionEngine이 태깅 테이블로 처리한 것만 제외 (handled_tables)
+#   handled_tables 없이 호출하면 최상위 테이블은 모두 제외
+
+NS_A = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+NS_P = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+NS_MC = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+
+A_P = f'{{{NS_A}}}p'
+A_T = f'{{{NS_A}}}t'
+A_BR = f'{{{NS_A}}}br'
+A_TBL = f'{{{NS_A}}}tbl'
+A_TR = f'{{{NS_A}}}tr'
+A_TC = f'{{{NS_A}}}tc'
+A_TXBODY = f'{{{NS_A}}}txBody'
+P_SP = f'{{{NS_P}}}sp'
+P_GRPSP = f'{{{NS_P}}}grpSp'
+P_GRAPHICFRAME = f'{{{NS_P}}}graphicFrame'
+P_TXBODY = f'{{{NS_P}}}txBody'
+P_CSLD = f'{{{NS_P}}}cSld'
+P_SPTREE = f'{{{NS_P}}}spTree'
+P_NVSPPR = f'{{{NS_P}}}nvSpPr'
+P_NVPR = f'{{{NS_P}}}nvPr'
+P_PH = f'{{{NS_P}}}ph'
+MC_ALTERNATE = f'{{{NS_MC}}}AlternateContent'
+
+NO_ONLY = re.compile(r'^\s*(\d+)\s*[.)]?\s*$')
+NO_PREFIX = re.compile(r'^\s*(\d+)\s*[.)]\s')
+
+TITLE_PH_TYPES = ('title', 'ctrTitle')
+SLIDE_NUMBER_PH_TYPE = 'sldNum'
+
+
+def paragraph_text(paragraph) -> str:
+    parts = []
+    for node in paragraph.iter(A_T, A_BR):
+        parts.append('\n' if node.tag == A_BR else (node.text or ''))
+    return ''.join(parts)
+
+
+def body_text(body) -> str:
+    #txBody 전체 텍스트 (문단은 줄바꿈으로 구분)#
+    return '\n'.join(paragraph_text(p) for p in body.iterfind(A_P))
+
+
+def leading_action(text, hint=None) -> str:
+    #속성 텍스트 앞의 설명 문구 (첫 줄)#
+    match = (hint or default_schema().hint_pattern).search(text)
+    head = text[:match.start()] if match else text
+    for line in head.split('\n'):
+        line = NO_PREFIX.sub('', line, count=1).strip()
+        if line and not NO_ONLY.match(line):
+            return line
+    return ''
+
+
+class _SlideWalk:
+    #한 슬라이드(또는 노트)의 도형 트리 순회 상태#
+
+    def __init__(self, scanner, slide_num, source_root, include_top_tables, handled_tables=None):
+        self.scanner = scanner
+        self.slide_num = slide_num
+        self.include_top_tables = include_top_tables
+        self.handled_tables = handled_tables
+        self.source_root = source_root
+        self.hint = scanner.hint
+        self.current_no = None
+        self.title = None
+        self.hits = []
+
+    def add_hit(self, text, source, no):
+        attributes = self.scanner.extract_attributes(text)
+        if not attributes:
+            return
+        self.hits.append({
+            'No': no,
+            'Slide': self.slide_num,
+            'Action': leading_action(text, self.hint),
+            'Source': source,
+            **attributes
+        })
+
+    def walk(self, tree, depth=0):
+        for child in tree:
+            tag = child.tag
+            if tag == P_SP:
+                self.shape(child, depth)
+            elif tag == P_GRPSP:
+                self.walk(child, depth + 1)
+            elif tag == P_GRAPHICFRAME:
+                for table in child.iter(A_TBL):
+                    if depth > 0 or self.include_top_table(table):
+                        self.table(table, depth)
+            elif tag == MC_ALTERNATE:
+                # 첫 번째 선택지만 사용 (Choice/Fallback 중복 방지)
+                for option in child:
+                    self.walk(option, depth)
+                    break
+
+    def include_top_table(self, table) -> bool:
+        if self.include_top_tables:
+            return True
+        return self.handled_tables is not None and table not in self.handled_tables
+
+    def source(self, depth):
+        if self.source_root:
+            return self.source_root
+        return 'group' if depth > 0 else 'text'
+
+    def shape(self, sp, depth):
+        body = sp.find(P_TXBODY)
+        if body is None:
+            return
+        ph = sp.find(f'{P_NVSPPR}/{P_NVPR}/{P_PH}')
+        ph_type = ph.get('type') if ph is not None else None
+        if ph_type == SLIDE_NUMBER_PH_TYPE:
+            # 슬라이드 번호 자리표시자는 번호 배지가 아님
+            return
+        text = body_text(body)
+
+        if self.title is None and ph_type in TITLE_PH_TYPES:
+            self.title = text.strip()
+
+        # 번호 배지 (숫자만 있는 도형) -> 이후 속성의 No
+        match = NO_ONLY.match(text)
+        if match:
+            self.current_no = int(match.group(1))
+            return
+
+        if not self.hint.search(text):
+            return
+
+        # 문단 단위로 No 접두어('1. ', '2) ')가 있으면 그 문단부터 해당 No
+        chunk = []
+        for line in text.split('\n'):
+            match = NO_PREFIX.match(line) or NO_ONLY.match(line)
+            if match:
+                if chunk:
+                    self.add_hit('\n'.join(chunk), self.source(depth), self.current_no)
+                self.current_no = int(match.group(1))
+                chunk = []
+            chunk.append(line)
+        if chunk:
+            self.add_hit('\n'.join(chunk), self.source(depth), self.current_no)
+
+    def table(self, table, depth):
+        source = self.source_root or ('group-table' if depth > 0 else 'table')
+        for tr in table.iterfind(A_TR):
+            cells = []
+            for tc in tr.iterfind(A_TC):
+                body = tc.find(A_TXBODY)
+                cells.append(body_text(body).strip() if body is not None else '')
+            if cells and cells[0].isdigit():
+                self.current_no = int(cells[0])
+            row_text = ' '.join(cells)
+            if self.hint.search(row_text):
+                self.add_hit(row_text, source, self.current_no)
+
+
+class DeepScanner:
+    def __init__(self, include_top_tables=False, include_notes=True):
+        self.include_top_tables = include_top_tables
+        self.include_notes = include_notes
+        # 스키마는 import 시점이 아니라 스캐너를 만들 때 로드 (잘못된 스키마는 호출한 쪽에서 처리)
+        schema = default_schema()
+        self.extract_attributes = schema.extract_attributes
+        # 속성 텍스트가 있을 수 있는 단위인지 빠르게 판단 (run을 합친 문단 텍스트 기준, 스키마의 속성 이름)
+        self.hint = schema.hint_pattern
+
+    def scan_tree(self, root, slide_num, source_root=None, handled_tables=None) -> _SlideWalk:
+        walk = _SlideWalk(self, slide_num, source_root, self.include_top_tables, handled_tables)
+        sp_tree = root.find(f'{P_CSLD}/{P_SPTREE}')
+        if sp_tree is not None:
+            walk.walk(sp_tree)
+        return walk
+
+    def scan_presentation(self, presentation, handled_tables=None) -> List[Dict]:
+        #python-pptx가 이미 파싱한 XML 트리를 그대로 순회 (추가 파싱 없음)
+        #handled_tables: ExtractionEngine이 이미 추출한 최상위 테이블 요소 (나머지 최상위 테이블은 검사)#
+        hits = []
+        for slide_num, slide in enumerate(presentation.slides, 1):
+            walk = self.scan_tree(slide._element, slide_num, handled_tables=handled_tables)
+            slide_hits = walk.hits
+
+            # notes_slide는 없으면 새로 만들므로 has_notes_slide 먼저 확인
+            if self.include_notes and slide.has_notes_slide:
+                notes_walk = self.scan_tree(slide.notes_slide._element, slide_num, 'notes')
+                slide_hits.extend(notes_walk.hits)
+
+            title = walk.title or "제목 없음"
+            for hit in slide_hits:
+                hit['Title'] = title
+            hits.extend(slide_hits)
+        return hits
+
+    def scan_package(self, package: MappedPackage) -> List[Dict]:
+        hits = []
+        for slide_num, name in enumerate(package.slide_part_names(), 1):
+            walk = self.scan_tree(package.parse_part(name), slide_num)
+            slide_hits = walk.hits
+
+            if self.include_notes:
+                notes = package.notes_part_name(name)
+                if notes:
+                    notes_walk = self.scan_tree(package.parse_part(notes), slide_num, 'notes')
+                    slide_hits.extend(notes_walk.hits)
+
+            title = walk.title or "제목 없음"
+            for hit in slide_hits:
+                hit['Title'] = title
+            hits.extend(slide_hits)
+        return hits
+
+    def scan(self, path) -> List[Dict]:
+        with MappedPackage(path) as package:
+            return self.scan_package(package)
@@ -0,0 +1,205 @@
+from typing import Dict
+
+import os
+import sys
+import json
+import time
+import argparse
+
+from pptx import Presentation
+
+from slide_scanner import SlideScanner
+from extraction_engine import STRATEGIES, DEFAULT_ORDER, ExtractionEngine, read_table, table_signature
+from tag_schema import default_schema
+from deep_scanner import DeepScanner
+from deck_extractor import collect_decks
+
+# 파싱 전략 비교 / 벤치마크 도구
+# 코퍼스의 모든 태깅 테이블에 대해 일치하는 전략을 각각 실행하고
+# 테이블 유형(헤더 시그니처)별 처리량과 출력 차이를 보고
+#
+#   python extraction_bench.py <pptx 파일 또는 폴더> [...] [--repeat 5] [--json report.json]
+#   python extraction_bench.py <...> --deep   (테이블 전용 추출 대비 딥 스캔 추가 비용)
+
+def normalize(records) -> set:
+    #전략 간 비교용 정규화 - Action/Title 표기 차이는 무시하고 (Slide, No, 속성)만 비교#
+    attribute_keys = default_schema().attributes
+    keys = set()
+    for record in records:
+        attrs = tuple(record.get(key) or '' for key in attribute_keys)
+        if any(attrs):
+            keys.add((record.get('Slide'), str(record.get('No')).strip(), attrs))
+    return keys
+
+
+def load_tables(deck):
+    #덱의 모든 테이블 (시그니처, 슬라이드, 행) 목록#
+    presentation = Presentation(deck)
+    scanner = SlideScanner()
+    tables = []
+    for slide_num, slide in enumerate(presentation.slides, 1):
+        for table in scanner.scan(slide, slide_num).tables:
+            rows = read_table(table)
+            if rows:
+                tables.append((table_signature(rows[0]), slide_num, rows))
+    return tables
+
+
+def run_benchmark(decks, repeat=3) -> Dict:
+    stats = {}  # 시그니처 -> 전략별 집계
+
+    for deck in decks:
+        for signature, slide_num, rows in load_tables(deck):
+            header = rows[0]
+            matched = [strategy for strategy in STRATEGIES.values() if strategy.matches(header)]
+            if not matched:
+                continue
+
+            entry = stats.setdefault(signature, {'tables': 0, 'rows': 0, 'strategies': {}})
+            entry['tables'] += 1
+            entry['rows'] += len(rows)
+
+            for strategy in matched:
+                best = None
+                records = []
+                for _ in range(max(1, repeat)):
+                    start = time.perf_counter()
+                    records = list(strategy.parse(rows, slide_num, ""))
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+
+                result = entry['strategies'].setdefault(
+                    strategy.name, {'seconds': 0.0, 'records': 0, 'keys': set()})
+                result['seconds'] += best
+                result['records'] += len(records)
+                result['keys'] |= {(deck,) + key for key in normalize(records)}
+
+    return stats
+
+
+def summarize(stats, reference=DEFAULT_ORDER[0]) -> Dict:
+    #시그니처별 처리량, 기준 전략 대비 차이, 추천 전략#
+    summary = {}
+    for signature, entry in stats.items():
+        strategies = entry['strategies']
+        ref_keys = strategies[reference]['keys'] if reference in strategies else None
+        rows = {}
+        for name, result in strategies.items():
+            seconds = result['seconds']
+            item = {
+                'records': result['records'],
+                'seconds': round(seconds, 6),
+                'rows_per_sec': round(entry['rows'] / seconds, 1) if seconds else None,
+            }
+            if ref_keys is not None and name != reference:
+                item['missing_vs_reference'] = len(ref_keys - result['keys'])
+                item['extra_vs_reference'] = len(result['keys'] - ref_keys)
+            rows[name] = item
+
+        # 기준 전략과 출력이 같은 전략 중 가장 빠른 것
+        agreeing = [name for name, result in strategies.items()
+                    if ref_keys is None or result['keys'] == ref_keys]
+        recommended = min(agreeing, key=lambda name: strategies[name]['seconds']) if agreeing else reference
+
+        summary[" | ".join(signature)] = {
+            'signature': list(signature),
+            'tables': entry['tables'],
+            'rows': entry['rows'],
+            'strategies': rows,
+            'recommended': recommended,
+        }
+    return summary
+
+
+def recommended_overrides(summary) -> Dict[tuple, str]:
+    #ExtractionEngine(overrides=...)에 넘길 수 있는 형태#
+    return {tuple(item['signature']): item['recommended'] for item in summary.values()}
+
+
+def print_summary(summary):
+    for label, item in summary.items():
+        print(f"[{label}] 테이블 {item['tables']}개, 행 {item['rows']}개 -> 추천: {item['recommended']}")
+        for name, result in item['strategies'].items():
+            line = f"  - {name:<8} 레코드 {result['records']:>7}  {result['seconds']:.4f}초  {result['rows_per_sec']} rows/s"
+            if 'missing_vs_reference' in result:
+                line += f"  (기준 대비 누락 {result['missing_vs_reference']}, 추가 {result['extra_vs_reference']})"
+            print(line)
+
+
+def best_time(func, repeat):
+    best = None
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_deep_benchmark(decks, repeat=3) -> Dict:
+    #덱별 테이블 전용 추출(로드 포함) 시간과 딥 스캔 추가 시간 비교#
+    results = {}
+    for deck in decks:
+        table_seconds, records = best_time(lambda: ExtractionEngine().extract(Presentation(deck)), repeat)
+
+        # 앱과 같은 방식: 이미 로드된 Presentation의 XML 트리 재사용, 엔진이 처리한 테이블만 제외
+        presentation = Presentation(deck)
+        engine = ExtractionEngine()
+        engine.extract(presentation)
+        deep_seconds, hits = best_time(
+            lambda: DeepScanner().scan_presentation(presentation, engine.handled_tables), repeat)
+
+        # 단독 실행 (mmap 리더로 파트를 직접 파싱)
+        standalone_seconds, _ = best_time(lambda: DeepScanner().scan(deck), repeat)
+
+        results[deck] = {
+            'table_seconds': round(table_seconds, 6),
+            'table_records': len(records),
+            'deep_seconds': round(deep_seconds, 6),
+            'deep_hits': len(hits),
+            'overhead_ratio': round(deep_seconds / table_seconds, 4) if table_seconds else None,
+            'standalone_seconds': round(standalone_seconds, 6),
+        }
+    return results
+
+
+def print_deep_summary(results):
+    total_table = sum(item['table_seconds'] for item in results.values())
+    total_deep = sum(item['deep_seconds'] for item in results.values())
+    for deck, item in results.items():
+        print(f"[{os.path.basename(deck)}] 테이블 {item['table_seconds']:.4f}초 ({item['table_records']}개)"
+              f"  딥 스캔 +{item['deep_seconds']:.4f}초 ({item['deep_hits']}개)  비율 {item['overhead_ratio']}"
+              f"  (단독 {item['standalone_seconds']:.4f}초)")
+    if total_table:
+        print(f"전체: 테이블 {total_table:.4f}초, 딥 스캔 +{total_deep:.4f}초 ({total_deep / total_table:.1%})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="태깅 테이블 파싱 전략 비교/벤치마크")
+    parser.add_argument('paths', nargs='+', help=".pptx 파일 또는 폴더")
+    parser.add_argument('--repeat', type=int, default=3, help="전략별 반복 측정 횟수 (최솟값 사용)")
+    parser.add_argument('--json', dest='json_path', help="결과를 JSON으로 저장")
+    parser.add_argument('--deep', action='store_true', help="딥 스캔 추가 비용 측정")
+    args = parser.parse_args(argv)
+
+    decks = collect_decks(args.paths)
+    if not decks:
+        print("대상 .pptx 파일이 없습니다.")
+        return 1
+
+    if args.deep:
+        summary = run_deep_benchmark(decks, args.repeat)
+        print_deep_summary(summary)
+    else:
+        summary = summarize(run_benchmark(decks, args.repeat))
+        print_summary(summary)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
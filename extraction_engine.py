@@ -0,0 +1,317 @@
+from typing import List, Dict, Optional, Iterator
+
+from slide_scanner import SlideScanner
+from progress_tracker import ProgressTracker, presentation_weights
+from tag_schema import default_schema
+
+# 태깅 테이블 추출 엔진
+# - 슬라이드 도형은 SlideScanner로 1회 분류
+# - 테이블마다 헤더 행을 보고 파싱 전략(Strategy)을 선택
+#   * group  : No 그룹 / Action 휴리스틱 (ppttoexcel2) - No 행 아래에 이어지는 행(AA/GA 등)이 있는 표
+#   * header : 헤더 인덱스 기반 행 파싱 (구 main.py) - 한 행에 No와 태깅 속성이 모두 있는 표
+#   헤더가 여러 전략과 일치하면 데이터 행 모양(accepts)으로 판별
+# - 속성 이름/Action 키워드/제외 태그는 태깅 스키마(tag_schema)에서 가져옴
+
+
+def _no_log(message, msg_type="info"):
+    pass
+
+
+def read_row(row) -> List[str]:
+    #행의 셀 텍스트 (원문 그대로)#
+    return [cell.text for cell in row.cells]
+
+
+def read_table(table) -> List[List[str]]:
+    #테이블 전체 셀 텍스트를 한 번만 읽음#
+    return [read_row(row) for row in table.rows]
+
+
+def table_signature(header: List[str]) -> tuple:
+    #테이블 유형 식별용 헤더 시그니처#
+    return tuple(cell.strip().lower() for cell in header)
+
+
+class ParsingStrategy:
+    #파싱 전략 기본 클래스#
+    name = ""
+
+    def matches(self, header: List[str]) -> bool:
+        raise NotImplementedError
+
+    def may_match(self, header_text: str) -> bool:
+        #헤더 행 전체 문자열만으로 하는 빠른 사전 판별 (False면 matches도 False여야 함)#
+        return True
+
+    def accepts(self, rows: List[List[str]]) -> bool:
+        #헤더가 여러 전략과 일치할 때 데이터 행 모양으로 판별#
+        return True
+
+    def parse(self, rows: List[List[str]], slide_num, slide_title, log=_no_log) -> Iterator[Dict]:
+        raise NotImplementedError
+
+
+class GroupStrategy(ParsingStrategy):
+    #No 그룹 단위로 Action과 태깅 속성을 묶어서 추출#
+    name = "group"
+
+    def matches(self, header):
+        # 첫 번째 행에서 'No' 와 'Tagging' 확인
+        first_row_text = " ".join(cell.strip().lower() for cell in header)
+        return ('no.' in first_row_text or 'no' in first_row_text) and 'tagging' in first_row_text
+
+    def may_match(self, header_text):
+        return 'tagging' in header_text.lower()
+
+    def accepts(self, rows):
+        # No 칸이 비어 있고 다른 칸에 내용이 있는 행 = 앞 No 그룹에 이어지는 행
+        return any(row and not row[0].strip() and any(cell.strip() for cell in row[1:]) for row in rows[1:])
+
+    def parse(self, rows, slide_num, slide_title, log=_no_log):
+        all_rows = [[cell.strip() if cell else "" for cell in row] for row in rows]
+
+        # 헤더 행 건너뛰기
+        data_start_idx = 0
+        for idx, row in enumerate(all_rows):
+            if any('tagging' in cell.lower() for cell in row):
+                data_start_idx = idx + 1
+                break
+
+        # 데이터 행 처리
+        current_no = None
+        current_group_data = []
+
+        for row_idx in range(data_start_idx, len(all_rows)):
+            row = all_rows[row_idx]
+            if not any(row):  # 빈 행
+                continue
+
+            # No 확인 (첫 번째 열)
+            first_cell = row[0] if row else ""
+
+            # 새로운 No 그룹 시작
+            if first_cell.isdigit():
+                # 이전 그룹 처리
+                if current_no and current_group_data:
+                    yield from self.process_group_data(current_no, current_group_data, slide_num, slide_title)
+
+                # 새 그룹 시작
+                current_no = int(first_cell)
+                current_group_data = [row]
+
+            # 현재 그룹에 행 추가
+            elif current_no is not None:
+                current_group_data.append(row)
+
+        # 마지막 그룹 처리
+        if current_no and current_group_data:
+            yield from self.process_group_data(current_no, current_group_data, slide_num, slide_title)
+
+    def process_group_data(self, no, group_rows, slide_num, slide_title):
+        #No 그룹의 데이터 처리#
+        results = []
+        schema = default_schema()
+
+        # Action 찾기 (첫 번째 열(No) 제외)
+        actions = [cell for row in group_rows for cell in row[1:] if schema.is_action(cell)]
+
+        # 각 Action에 대한 태깅 정보 찾기
+        if not actions:  # Action이 없으면 전체를 하나의 항목으로 처리
+            actions = ['']
+
+        # 모든 행에서 태깅 정보 추출 (그룹당 한 번)
+        group_attrs = self.extract_tagging_attributes(" ".join(" ".join(row) for row in group_rows))
+        row_texts = [" ".join(row) for row in group_rows]
+
+        for action in actions:
+            result = {
+                'No': no,
+                'Slide': slide_num,
+                'Title': slide_title,
+                'Action': action
+            }
+            result.update(group_attrs)
+
+            # Action별로 개별 태깅이 있는 경우 처리
+            if action:
+                for row_text in row_texts:
+                    if action in row_text:
+                        # 해당 Action이 있는 행 주변의 태깅 정보 추출
+                        specific_attrs = self.extract_tagging_attributes(row_text)
+                        if specific_attrs:
+                            result.update(specific_attrs)
+
+            results.append(result)
+
+        return results
+
+    def extract_tagging_attributes(self, text):
+        #텍스트에서 태깅 속성 추출 (스키마의 통합 정규식 1회 검색)#
+        return default_schema().extract_attributes(text)
+
+
+class HeaderIndexStrategy(ParsingStrategy):
+    #'No.' 헤더 위치 기준으로 한 행 = 한 레코드로 추출#
+    name = "header"
+
+    def matches(self, header):
+        headers = [cell.strip() for cell in header]
+        return 'No.' in headers and 'Tagging Source' in headers
+
+    def may_match(self, header_text):
+        return 'Tagging Source' in header_text
+
+    def accepts(self, rows):
+        # 내용이 있는 모든 데이터 행에 No가 있어야 함 (한 행 = 한 레코드)
+        index = [cell.strip() for cell in rows[0]].index('No.')
+        return all(len(row) > index and row[index].strip() for row in rows[1:] if any(cell.strip() for cell in row))
+
+    def parse(self, rows, slide_num, slide_title, log=_no_log):
+        if len(rows) <= 1:
+            log(f"슬라이드 {slide_num}에 빈 테이블이 있습니다.", "warning")
+            return
+
+        headers = [cell.strip() for cell in rows[0]]
+        header_index_no = headers.index('No.')
+        header_index_action = header_index_no + 1  # 'Action' 컬럼 위치 추정
+
+        for row_idx in range(1, len(rows)):
+            row_cells = rows[row_idx]
+
+            # 행에 셀이 충분히 있는지 확인
+            if len(row_cells) <= max(header_index_no, header_index_action):
+                log(f"슬라이드 {slide_num}, 행 {row_idx}에 셀이 부족합니다.", "warning")
+                continue
+
+            try:
+                no = row_cells[header_index_no].strip()
+
+                # 줄바꿈이 있는 경우 첫 번째 줄만 사용
+                full_text = row_cells[1].strip() if len(row_cells) > 1 else ""
+                action = full_text.split("\n")[0]
+
+                # 모든 셀의 텍스트를 결합
+                row_text = ' '.join(row_cells)
+
+                extracted_data = default_schema().extract_strict(row_text)
+
+                yield {
+                    'Slide': slide_num,
+                    'Title': slide_title,
+                    'No': no,
+                    'Action': action,
+                    **extracted_data
+                }
+            except Exception as cell_error:
+                log(f"슬라이드 {slide_num}, 행 {row_idx} 처리 중 셀 오류: {cell_error}", "warning")
+
+
+STRATEGIES = {strategy.name: strategy for strategy in (GroupStrategy(), HeaderIndexStrategy())}
+DEFAULT_ORDER = ['group', 'header']
+
+
+class ExtractionEngine:
+    def __init__(self, order=None, overrides=None, log=None, progress=None, eta=None):
+        # order    : 헤더가 여러 전략과 일치할 때 우선순위
+        # overrides: 테이블 시그니처 -> 전략 이름 (벤치마크 결과로 고정)
+        # progress : 진행률 (0~90, 태깅 테이블 행 수 가중), eta: 남은 시간(초)
+        self.strategies = [STRATEGIES[name] for name in (order or DEFAULT_ORDER)]
+        self.overrides = overrides or {}
+        self.log = log or _no_log
+        self.progress = progress or (lambda value: None)
+        self.eta = eta
+        self.scanner = SlideScanner()
+        # 마지막 extract()에서 전략이 선택된 최상위 테이블 요소(a:tbl) - 딥 스캔에서 중복 추출하지 않도록
+        self.handled_tables = set()
+
+    def candidates(self, header) -> List[ParsingStrategy]:
+        #헤더와 일치하는 전략 (우선순위 순, override가 있으면 그 전략만)#
+        name = self.overrides.get(table_signature(header))
+        if name in STRATEGIES:
+            return [STRATEGIES[name]]
+        matched = []
+        for strategy in self.strategies:
+            try:
+                if strategy.matches(header):
+                    matched.append(strategy)
+            except Exception:
+                continue
+        return matched
+
+    def choose(self, candidates, rows) -> Optional[ParsingStrategy]:
+        #후보가 여럿이면 데이터 행 모양을 받아들이는 첫 전략 (없으면 우선순위 첫 전략)#
+        if len(candidates) > 1 and rows:
+            for strategy in candidates:
+                try:
+                    if strategy.accepts(rows):
+                        return strategy
+                except Exception:
+                    continue
+        return candidates[0] if candidates else None
+
+    def select_strategy(self, header, rows=None) -> Optional[ParsingStrategy]:
+        #테이블 헤더(+ 전체 행)로 파싱 전략 선택 - rows가 없으면 헤더만으로 우선순위 첫 전략#
+        return self.choose(self.candidates(header), rows)
+
+    def may_match(self, header_text) -> bool:
+        #진행률 가중치 계산용 - 헤더 행 문자열로 태깅 테이블일 가능성 판단#
+        if self.overrides:
+            return True
+        return any(strategy.may_match(header_text) for strategy in self.strategies)
+
+    def slide_title(self, slide, slide_num) -> str:
+        #테이블 외 경로(딥 스캔 등)로 찾은 레코드의 슬라이드 제목#
+        return self.scanner.scan(slide, slide_num).title
+
+    def parse_table(self, strategy, rows, slide_num, slide_title) -> List[Dict]:
+        #전략 실행 - 오류가 나도 그 전까지의 레코드는 유지#
+        extracted = []
+        try:
+            for record in strategy.parse(rows, slide_num, slide_title, self.log):
+                extracted.append(record)
+        except Exception as e:
+            self.log(f"테이블 데이터 추출 오류: {str(e)}", "error")
+        return extracted
+
+    def extract(self, presentation) -> List[Dict]:
+        table_data = []
+        self.handled_tables = set()
+
+        # 슬라이드별 작업량(태깅 테이블 행 수)을 먼저 세어 진행률 가중치로 사용
+        try:
+            weights = presentation_weights(presentation, self.may_match)
+        except Exception:
+            weights = [1] * len(presentation.slides)
+        tracker = ProgressTracker(weights, self.progress, self.eta)
+
+        for slide_idx, slide in enumerate(presentation.slides):
+            # 도형 1회 순회로 제목 후보/테이블 분류
+            scan = self.scanner.scan(slide, slide_idx + 1)
+
+            for table in scan.tables:
+                # 헤더 행만 먼저 읽어서 전략 선택 (태깅 테이블이 아니면 나머지 행은 읽지 않음)
+                try:
+                    rows = table.rows
+                    if len(rows) == 0:
+                        continue
+                    header = read_row(rows[0])
+                except Exception:
+                    continue
+
+                candidates = self.candidates(header)
+                if not candidates:
+                    continue
+                self.handled_tables.add(table._tbl)
+
+                rows = read_table(table)
+                strategy = self.choose(candidates, rows)
+
+                # 제목은 태깅 테이블이 있는 슬라이드에서만 계산
+                extracted_data = self.parse_table(strategy, rows, scan.slide_num, scan.title)
+                table_data.extend(extracted_data)
+                self.log(f"슬라이드 {scan.slide_num}: {scan.title}", "info")
+                self.log(f"  - {len(extracted_data)}개 태깅 데이터 추출", "success")
+
+            tracker.advance(slide_idx)
+
+        return table_data
@@ -0,0 +1,363 @@
+from typing import List, Optional, Callable
+
+import os
+import sys
+import time
+import errno
+import threading
+import multiprocessing
+
+from pptx_package import MappedPackage
+from ppt_converter import PPTConverter, ConversionError, is_legacy_ppt
+
+# 덱 하나를 별도 워커 프로세스에서 추출 (시간/메모리 한도 적용)
+# - 한도를 넘거나 비정상 종료된 워커는 종료 후 새로 띄움 (다른 작업/GUI에 영향 없음)
+# - 메모리 한도: POSIX는 RLIMIT_AS, Windows는 Job Object 프로세스 메모리 한도
+# - 로드 전에 zip 중앙 디렉터리로 압축 해제 크기/비율을 검사 (zip bomb 방지)
+# - .ppt 변환(soffice)은 워커에 보내기 전에 부모에서 실행
+#   (워커를 종료해도 soffice가 남지 않고, soffice가 워커의 메모리 한도를 물려받지 않음)
+
+DEFAULT_TIMEOUT = 300           # 초
+DEFAULT_MEMORY_MB = 2048
+DEFAULT_MAX_UNCOMPRESSED_MB = 1024
+DEFAULT_MAX_RATIO = 200         # 파트별 최대 압축률
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+STATUS_TIMEOUT = 'timeout'
+STATUS_MEMORY = 'memory'
+STATUS_REJECTED = 'rejected'
+STATUS_CRASHED = 'crashed'
+
+
+class ResourceLimitError(Exception):
+    pass
+
+
+class DeckResult:
+    __slots__ = ('path', 'status', 'records', 'message', 'seconds', 'output')
+
+    def __init__(self, path, status, records=None, message="", seconds=0.0):
+        self.path = path
+        self.status = status
+        self.records = records or []
+        self.message = message
+        self.seconds = seconds
+        self.output = None  # 파이프라인 writer 단계가 만든 출력 파일
+
+    @property
+    def ok(self):
+        return self.status == STATUS_OK
+
+    def __repr__(self):
+        return f"DeckResult({os.path.basename(self.path)!r}, {self.status}, {len(self.records)} records)"
+
+
+def check_package(path, max_uncompressed_mb=DEFAULT_MAX_UNCOMPRESSED_MB, max_ratio=DEFAULT_MAX_RATIO, data=None):
+    #압축 해제 전에 중앙 디렉터리 정보만으로 위험한 패키지 거부 (data: 미리 읽은 파일 내용)#
+    if os.path.splitext(path)[1].lower() != '.pptx':
+        return
+    limit = max_uncompressed_mb * 1024 * 1024
+    with MappedPackage(path, data) as package:
+        total = 0
+        for entry in package.entries.values():
+            total += entry.size
+            if entry.size > 1024 * 1024 and entry.size > entry.compressed_size * max_ratio:
+                raise ResourceLimitError(f"비정상적인 압축률의 파트: {entry.name}")
+        if total > limit:
+            raise ResourceLimitError(
+                f"압축 해제 크기 {total // (1024 * 1024)}MB가 한도 {max_uncompressed_mb}MB를 넘습니다.")
+
+
+# ---- 워커 프로세스 ----
+
+def _apply_posix_memory_limit(memory_mb):
+    try:
+        import resource
+    except ImportError:
+        return
+    limit = memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+
+def _worker_main(conn, memory_mb, max_uncompressed_mb):
+    #워커 루프 - 작업(경로, deep, 파일 내용)을 받아 결과 메시지를 돌려줌#
+    # 모듈(공유 라이브러리 포함)은 한도 적용 전에 로드 - 한도는 덱 처리에만 적용
+    from deck_extractor import extract_deck
+
+    if memory_mb and sys.platform != 'win32':
+        _apply_posix_memory_limit(memory_mb)
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+
+        path, deep, data = job
+        try:
+            check_package(path, max_uncompressed_mb, data=data)
+            records = extract_deck(
+                path,
+                log=lambda message, msg_type="info": conn.send(('log', message, msg_type)),
+                progress=lambda value: conn.send(('progress', value)),
+                eta=lambda seconds: conn.send(('eta', seconds)),
+                deep=deep,
+                data=data
+            )
+            conn.send((STATUS_OK, records))
+        except ResourceLimitError as e:
+            conn.send((STATUS_REJECTED, str(e)))
+        except (MemoryError, OSError) as e:
+            if isinstance(e, OSError) and e.errno != errno.ENOMEM:
+                conn.send((STATUS_ERROR, str(e)))
+                continue
+            records = data = None
+            # 메모리 상태를 신뢰할 수 없으므로 결과만 알리고 종료 (부모가 새 워커를 띄움)
+            try:
+                conn.send((STATUS_MEMORY, "메모리 한도를 초과했습니다."))
+            finally:
+                os._exit(3)
+        except Exception as e:
+            conn.send((STATUS_ERROR, str(e)))
+
+
+class _WindowsJob:
+    #Windows Job Object로 프로세스 메모리 한도 적용 (핸들을 닫으면 프로세스도 종료)#
+
+    def __init__(self, pid, memory_mb):
+        import ctypes
+        from ctypes import wintypes
+
+        class IO_COUNTERS(ctypes.Structure):
+            _fields_ = [(name, ctypes.c_ulonglong) for name in (
+                'ReadOperationCount', 'WriteOperationCount', 'OtherOperationCount',
+                'ReadTransferCount', 'WriteTransferCount', 'OtherTransferCount')]
+
+        class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+            _fields_ = [
+                ('PerProcessUserTimeLimit', ctypes.c_int64),
+                ('PerJobUserTimeLimit', ctypes.c_int64),
+                ('LimitFlags', wintypes.DWORD),
+                ('MinimumWorkingSetSize', ctypes.c_size_t),
+                ('MaximumWorkingSetSize', ctypes.c_size_t),
+                ('ActiveProcessLimit', wintypes.DWORD),
+                ('Affinity', ctypes.c_size_t),
+                ('PriorityClass', wintypes.DWORD),
+                ('SchedulingClass', wintypes.DWORD),
+            ]
+
+        class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+            _fields_ = [
+                ('BasicLimitInformation', JOBOBJECT_BASIC_LIMIT_INFORMATION),
+                ('IoInfo', IO_COUNTERS),
+                ('ProcessMemoryLimit', ctypes.c_size_t),
+                ('JobMemoryLimit', ctypes.c_size_t),
+                ('PeakProcessMemoryUsed', ctypes.c_size_t),
+                ('PeakJobMemoryUsed', ctypes.c_size_t),
+            ]
+
+        JOB_OBJECT_LIMIT_PROCESS_MEMORY = 0x00000100
+        JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x00002000
+        JOB_OBJECT_EXTENDED_LIMIT_INFORMATION_CLASS = 9
+        PROCESS_SET_QUOTA = 0x0100
+        PROCESS_TERMINATE = 0x0001
+
+        self._kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        self.handle = self._kernel32.CreateJobObjectW(None, None)
+        if not self.handle:
+            raise OSError(ctypes.get_last_error(), "CreateJobObject 실패")
+
+        info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+        info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_PROCESS_MEMORY | JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+        info.ProcessMemoryLimit = memory_mb * 1024 * 1024
+        self._kernel32.SetInformationJobObject(
+            self.handle, JOB_OBJECT_EXTENDED_LIMIT_INFORMATION_CLASS, ctypes.byref(info), ctypes.sizeof(info))
+
+        process = self._kernel32.OpenProcess(PROCESS_SET_QUOTA | PROCESS_TERMINATE, False, pid)
+        if process:
+            self._kernel32.AssignProcessToJobObject(self.handle, process)
+            self._kernel32.CloseHandle(process)
+
+    def close(self):
+        if self.handle:
+            self._kernel32.CloseHandle(self.handle)
+            self.handle = None
+
+
+class _Worker:
+    def __init__(self, context, memory_mb, max_uncompressed_mb):
+        self.context = context
+        self.memory_mb = memory_mb
+        self.max_uncompressed_mb = max_uncompressed_mb
+        self.process = None
+        self.conn = None
+        self.job = None
+
+    def alive(self):
+        return self.process is not None and self.process.is_alive()
+
+    def start(self):
+        parent_conn, child_conn = self.context.Pipe()
+        self.process = self.context.Process(
+            target=_worker_main, args=(child_conn, self.memory_mb, self.max_uncompressed_mb), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        if self.memory_mb and sys.platform == 'win32':
+            try:
+                self.job = _WindowsJob(self.process.pid, self.memory_mb)
+            except Exception:
+                self.job = None
+
+    def kill(self):
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join(5)
+        if self.conn is not None:
+            self.conn.close()
+        if self.job is not None:
+            self.job.close()
+        self.process = self.conn = self.job = None
+
+    def stop(self):
+        if self.alive():
+            try:
+                self.conn.send(None)
+                self.process.join(2)
+            except (OSError, EOFError):
+                pass
+        self.kill()
+
+    def run(self, path, timeout, deep=True, on_log=None, on_progress=None, data=None, on_eta=None) -> DeckResult:
+        #작업 하나 실행 - 한도 초과 시 워커를 종료하고 결과로 보고
+        #data: 미리 읽은 파일 내용 (없으면 워커가 경로에서 직접 읽음)#
+        if not self.alive():
+            self.kill()
+            self.start()
+
+        start = time.perf_counter()
+        deadline = start + timeout if timeout else None
+
+        def result(status, records=None, message=""):
+            return DeckResult(path, status, records, message, time.perf_counter() - start)
+
+        load_path = path
+        if is_legacy_ppt(path):
+            # 변환 시간도 덱 처리 시간 한도에 포함 (초과 시 soffice 프로세스 그룹 전체 종료)
+            if on_log:
+                on_log(".ppt 파일을 .pptx로 변환 중...", "info")
+            try:
+                converter = PPTConverter(timeout=timeout) if timeout else PPTConverter()
+                load_path = converter.ensure_pptx(path)
+            except ConversionError as e:
+                timed_out = deadline is not None and deadline <= time.perf_counter()
+                return result(STATUS_TIMEOUT if timed_out else STATUS_ERROR, message=str(e))
+            except Exception as e:
+                return result(STATUS_ERROR, message=f".ppt 변환 오류: {e}")
+            data = None
+            if deadline is not None and deadline <= time.perf_counter():
+                return result(STATUS_TIMEOUT, message=f"처리 시간 {timeout}초를 초과하여 중단했습니다.")
+
+        try:
+            self.conn.send((load_path, deep, data))
+        except (OSError, EOFError) as e:
+            self.kill()
+            return result(STATUS_CRASHED, message=f"워커에 작업을 보낼 수 없습니다: {e}")
+
+        while True:
+            wait = 0.1 if deadline is None else min(0.1, deadline - time.perf_counter())
+            if wait <= 0:
+                self.kill()
+                return result(STATUS_TIMEOUT, message=f"처리 시간 {timeout}초를 초과하여 중단했습니다.")
+
+            try:
+                ready = self.conn.poll(wait)
+                message = self.conn.recv() if ready else None
+            except (OSError, EOFError):
+                ready, message = True, None
+
+            if message is None:
+                if ready or not self.process.is_alive():
+                    # 메시지 없이 죽은 경우 (OS가 메모리 한도로 종료 등)
+                    exitcode = self.process.exitcode if self.process else None
+                    self.kill()
+                    return result(STATUS_CRASHED, message=f"워커가 비정상 종료되었습니다 (exit code {exitcode}).")
+                continue
+
+            kind = message[0]
+            if kind == 'log':
+                if on_log:
+                    on_log(message[1], message[2])
+            elif kind == 'progress':
+                if on_progress:
+                    on_progress(message[1])
+            elif kind == 'eta':
+                if on_eta:
+                    on_eta(message[1])
+            elif kind == STATUS_OK:
+                return result(STATUS_OK, message[1])
+            else:
+                if kind == STATUS_MEMORY:
+                    self.kill()
+                return result(kind, message=message[1])
+
+
+class IsolatedPool:
+    def __init__(self, workers=2, timeout=DEFAULT_TIMEOUT, memory_mb=DEFAULT_MEMORY_MB,
+                 max_uncompressed_mb=DEFAULT_MAX_UNCOMPRESSED_MB):
+        # spawn: Qt 스레드가 있는 부모를 fork하지 않도록 (Windows와 동일한 동작)
+        context = multiprocessing.get_context('spawn')
+        self.timeout = timeout
+        self._workers = [_Worker(context, memory_mb, max_uncompressed_mb) for _ in range(max(1, workers))]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def workers(self) -> List['_Worker']:
+        #워커를 직접 구동하는 호출자용 (파이프라인 등)#
+        return list(self._workers)
+
+    def close(self):
+        for worker in self._workers:
+            worker.stop()
+
+    def run_one(self, path, deep=True, on_log=None, on_progress=None, on_eta=None) -> DeckResult:
+        return self._workers[0].run(path, self.timeout, deep, on_log, on_progress, on_eta=on_eta)
+
+    def run(self, paths, deep=True, on_result: Optional[Callable[[DeckResult], None]] = None) -> List[DeckResult]:
+        #여러 덱을 워커 수만큼 병렬 처리 - 입력 순서대로 결과 반환#
+        results: List[Optional[DeckResult]] = [None] * len(paths)
+        lock = threading.Lock()
+        next_index = [0]
+
+        def drive(worker):
+            while True:
+                with lock:
+                    idx = next_index[0]
+                    if idx >= len(paths):
+                        return
+                    next_index[0] += 1
+                result = worker.run(paths[idx], self.timeout, deep)
+                results[idx] = result
+                if on_result:
+                    with lock:
+                        on_result(result)
+
+        threads = [threading.Thread(target=drive, args=(worker,), daemon=True)
+                   for worker in self._workers[:max(1, len(paths))]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
@@ -1,40 +1,157 @@
-from PyQt5.QtCore import QObject, pyqtSignal
-from PyQt5.QtWidgets import QApplication
+from array import array
+
+from PyQt5.QtCore import QObject, pyqtSignal, QAbstractListModel, QModelIndex, Qt, QTimer
+from PyQt5.QtGui import QColor, QBrush
+
+# 로그 타입 (모델에는 타입 코드만 저장)
+LOG_TYPES = ['normal', 'success', 'error', 'warning', 'info', 'separator']
+LOG_TYPE_CODES = {name: code for code, name in enumerate(LOG_TYPES)}
+
+LOG_COLORS = {
+    'normal': '#ffffff',
+    'success': '#2ecc71',
+    'error': '#e74c3c',
+    'warning': '#f39c12',
+    'info': '#3498db',
+    'separator': '#ffffff'
+}
+
+LOG_PREFIXES = {
+    'success': '[Pass] ',
+    'error': '[Error] ',
+    'warning': '[Warning] ',
+    'info': '[INFO] ',
+    'normal': '[log] '
+}
+
+# 필터 콤보 항목: (표시 이름, 포함할 타입들 - None이면 전체)
+LOG_FILTERS = [
+    ('전체', None),
+    ('오류', ('error',)),
+    ('경고', ('warning',)),
+    ('정보', ('info', 'normal', 'success')),
+]
+
+
+class LogModel(QAbstractListModel):
+    #로그 목록 모델 - 뷰는 화면에 보이는 행만 data()로 요청#
+    FLUSH_INTERVAL_MS = 50
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._messages = []
+        self._types = array('B')
+        self._visible = None  # 필터 적용 시 표시할 원본 인덱스 목록
+        self._type_filter = None
+        self._search = ''
+        self._pending = []
+
+        self._brushes = [QBrush(QColor(LOG_COLORS[name])) for name in LOG_TYPES]
+        self._prefixes = [LOG_PREFIXES.get(name, '') for name in LOG_TYPES]
+
+        # 짧은 간격으로 모아서 삽입 (메시지마다 뷰 갱신하지 않음)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    # ---- QAbstractListModel ----
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._messages) if self._visible is None else len(self._visible)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row() if self._visible is None else self._visible[index.row()]
+        if role == Qt.DisplayRole:
+            return self._prefixes[self._types[row]] + self._messages[row]
+        if role == Qt.ForegroundRole:
+            return self._brushes[self._types[row]]
+        return None
+
+    # ---- 로그 추가 ----
+
+    def append(self, message, type='normal'):
+        code = LOG_TYPE_CODES.get(type, 0)
+        if type == 'separator':
+            message = "─" * 100
+        self._pending.append((message, code))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        #대기 중인 로그를 한 번에 삽입#
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        start = len(self._messages)
+
+        if self._visible is None:
+            self.beginInsertRows(QModelIndex(), start, start + len(pending) - 1)
+            for message, code in pending:
+                self._messages.append(message)
+                self._types.append(code)
+            self.endInsertRows()
+            return
+
+        matched = []
+        for offset, (message, code) in enumerate(pending):
+            self._messages.append(message)
+            self._types.append(code)
+            if self._matches(message, code):
+                matched.append(start + offset)
+        if matched:
+            first = len(self._visible)
+            self.beginInsertRows(QModelIndex(), first, first + len(matched) - 1)
+            self._visible.extend(matched)
+            self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._messages = []
+        self._types = array('B')
+        self._pending = []
+        self._visible = None if self._type_filter is None and not self._search else array('L')
+        self.endResetModel()
+
+    # ---- 필터 / 검색 ----
+
+    def _matches(self, message, code):
+        if self._type_filter is not None and code not in self._type_filter:
+            return False
+        return not self._search or self._search in message.lower()
+
+    def set_filter(self, types=None, search=''):
+        #타입 필터와 검색어 적용 (대소문자 무시)#
+        self.flush()
+        self._type_filter = None if types is None else {LOG_TYPE_CODES[name] for name in types}
+        self._search = (search or '').strip().lower()
+
+        self.beginResetModel()
+        if self._type_filter is None and not self._search:
+            self._visible = None
+        else:
+            messages, types_ = self._messages, self._types
+            self._visible = array('L', (
+                row for row in range(len(messages)) if self._matches(messages[row], types_[row])
+            ))
+        self.endResetModel()
+
+    def total_count(self):
+        return len(self._messages) + len(self._pending)
+
 
 class Logger(QObject):
     # 시그널 추가
     log_signal = pyqtSignal(str, str)  # 메시지, 타입
 
-    def __init__(self, text_widget):
+    def __init__(self, model=None):
         super().__init__()
-        self.text_widget = text_widget
+        self.model = model
 
     def log(self, message, type='normal'):
-        # 메시지와 스타일 정보를 함께 시그널로 전달
-        styles = {
-            'normal': 'color: #ffffff',
-            'success': 'color: #2ecc71',
-            'error': 'color: #e74c3c',
-            'warning': 'color: #f39c12',
-            'info': 'color: #3498db',
-            'separator': 'color: #ffffff'
-        }
-
-        style = styles.get(type, styles['normal'])
-        base_style = f'font-family: Consolas; font-size: 9pt; {style}'
-
-        if type == 'separator':
-            message = "─" * 100
-        else:
-            emojis = {
-                'success': '[Pass] ',
-                'error': '[Error] ',
-                'warning': '[Warning] ',
-                'info': '[INFO] ',
-                'normal': '[log] '
-            }
-            message = f"{emojis.get(type, '')}{message}"
-
-        # 포맷된 HTML 메시지를 시그널로 전달
-        formatted_message = f'<span style="{base_style}">{message}</span><br>'
-        self.log_signal.emit(formatted_message, type)
\ No newline at end of file
+        # 메시지와 타입을 시그널로 전달 (표시 형식은 LogModel이 담당)
+        self.log_signal.emit(message, type)
@@ -0,0 +1,206 @@
+from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+import os
+import sys
+import signal
+import shutil
+import hashlib
+import pathlib
+import tempfile
+import subprocess
+
+# 레거시 .ppt -> .pptx 변환 (LibreOffice headless)
+# - 변환 결과는 원본 내용 해시로 캐시
+# - 배치는 워커별 soffice 프로세스 1개가 여러 파일을 한 번에 변환
+#   (여러 덱을 처리하는 진입점은 시작 전에 모든 .ppt를 convert_batch 한 번으로 변환)
+# - 일부 파일이 실패해도 나머지 결과는 그대로 반환 (실패는 파일별 메시지)
+
+WINDOWS_SOFFICE_PATHS = [
+    r"C:\Program Files\LibreOffice\program\soffice.exe",
+    r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+]
+
+
+class ConversionError(Exception):
+    pass
+
+
+def default_cache_dir():
+    #변환 캐시 기본 경로#
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "ppttoexcel", "ppt_cache")
+
+
+def find_soffice():
+    #LibreOffice 실행 파일 찾기#
+    for name in ('soffice', 'libreoffice'):
+        path = shutil.which(name)
+        if path:
+            return path
+    if sys.platform == 'win32':
+        for path in WINDOWS_SOFFICE_PATHS:
+            if os.path.exists(path):
+                return path
+    elif sys.platform == 'darwin':
+        path = "/Applications/LibreOffice.app/Contents/MacOS/soffice"
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def is_legacy_ppt(path):
+    return os.path.splitext(path)[1].lower() == '.ppt'
+
+
+def run_soffice(cmd, timeout):
+    #soffice를 별도 프로세스 그룹으로 실행 - 시간 초과 시 자식(soffice.bin 등)까지 모두 종료#
+    if sys.platform == 'win32':
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                   creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+    else:
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                   start_new_session=True)
+    try:
+        return process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        kill_process_tree(process)
+        raise
+
+
+def kill_process_tree(process):
+    if sys.platform == 'win32':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    process.kill()
+    process.wait()
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    #파일 내용 SHA-256#
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PPTConverter:
+    def __init__(self, cache_dir=None, soffice_path=None, workers=2, timeout=300):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.soffice_path = soffice_path
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def cached_path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.pptx")
+
+    def ensure_pptx(self, path) -> str:
+        #.pptx는 그대로, .ppt는 변환(또는 캐시) 경로 반환 - 실패 시 ConversionError#
+        if not is_legacy_ppt(path):
+            return path
+        converted, failed = self.convert_batch([path])
+        if path in failed:
+            raise ConversionError(failed[path])
+        return converted[path]
+
+    def convert_batch(self, paths: List[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        #여러 .ppt 파일을 변환 - 캐시에 없는 파일만 soffice로 처리
+        #반환: (원본 경로 -> 로드할 .pptx 경로, 원본 경로 -> 실패 메시지), .pptx는 그대로 통과#
+        results = {}
+        failed = {}
+        pending: Dict[str, List[str]] = {}  # 해시 -> 원본 경로들 (같은 내용은 한 번만 변환)
+
+        for path in paths:
+            if not is_legacy_ppt(path):
+                results[path] = path
+                continue
+            try:
+                digest = file_hash(path)
+            except OSError as e:
+                failed[path] = f".ppt 파일을 읽을 수 없습니다: {e}"
+                continue
+            target = self.cached_path(digest)
+            if os.path.exists(target):
+                results[path] = target
+            else:
+                pending.setdefault(digest, []).append(path)
+
+        if pending:
+            soffice = self.soffice_path or find_soffice()
+            if not soffice:
+                for sources in pending.values():
+                    for source in sources:
+                        failed[source] = ".ppt 변환에 필요한 LibreOffice(soffice)를 찾을 수 없습니다."
+                return results, failed
+
+            # 워커 수만큼 나누어 워커당 soffice 프로세스 1개로 일괄 변환
+            items = list(pending.items())
+            chunks = [items[i::self.workers] for i in range(self.workers) if items[i::self.workers]]
+            with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+                errors = {}
+                for chunk_errors in pool.map(lambda chunk: self._convert_chunk(soffice, chunk), chunks):
+                    errors.update(chunk_errors)
+
+            for digest, sources in pending.items():
+                target = self.cached_path(digest)
+                for source in sources:
+                    if os.path.exists(target):
+                        results[source] = target
+                    else:
+                        failed[source] = errors.get(digest) or f".ppt 변환 실패: {os.path.basename(source)}"
+
+        return results, failed
+
+    def _convert_chunk(self, soffice, chunk) -> Dict[str, str]:
+        #soffice 한 번 실행으로 chunk 전체 변환 - 반환: 해시 -> 실패 메시지 (시간 초과 등)#
+        errors = {}
+        with tempfile.TemporaryDirectory(dir=self.cache_dir) as work_dir:
+            # 사용자 프로필은 실행마다 별도 (같은 캐시를 쓰는 다른 프로세스/스레드의 soffice와 공유하면
+            # 프로필 잠금 때문에 변환 없이 종료됨) - chunk 안의 파일들은 한 번 기동한 soffice가 모두 처리
+            profile_url = pathlib.Path(os.path.abspath(os.path.join(work_dir, "profile"))).as_uri()
+
+            inputs = []
+            for digest, sources in chunk:
+                # 해시 이름으로 복사 - 파일명 충돌 및 경로 인코딩 문제 방지
+                src = os.path.join(work_dir, f"{digest}.ppt")
+                shutil.copyfile(sources[0], src)
+                inputs.append(src)
+
+            out_dir = os.path.join(work_dir, "out")
+            cmd = [
+                soffice, f"-env:UserInstallation={profile_url}",
+                "--headless", "--norestore", "--convert-to", "pptx",
+                "--outdir", out_dir, *inputs
+            ]
+            try:
+                run_soffice(cmd, self.timeout * len(inputs))
+            except subprocess.TimeoutExpired:
+                # 종료 시점에 쓰던 파일이 잘렸을 수 있으므로 chunk 전체를 실패로 처리
+                errors = {digest: ".ppt 변환 시간이 초과되었습니다." for digest, _ in chunk}
+            except OSError as e:
+                errors = {digest: f"soffice 실행 오류: {e}" for digest, _ in chunk}
+
+            for digest, _ in chunk:
+                converted = os.path.join(out_dir, f"{digest}.pptx")
+                if digest not in errors and os.path.exists(converted):
+                    os.replace(converted, self.cached_path(digest))
+        return errors
+
+
+def convert_decks(paths, converter: PPTConverter = None) -> Tuple[Dict[str, str], Dict[str, str]]:
+    #여러 덱을 처리하기 전에 .ppt를 한 번에 변환
+    #반환: (원본 -> 로드할 경로, 원본 -> 실패 메시지) - .pptx는 그대로, .ppt가 없으면 변환기도 만들지 않음#
+    load_paths = {path: path for path in paths if not is_legacy_ppt(path)}
+    legacy = [path for path in paths if is_legacy_ppt(path)]
+    if not legacy:
+        return load_paths, {}
+    converted, failed = (converter or PPTConverter()).convert_batch(legacy)
+    load_paths.update(converted)
+    return load_paths, failed
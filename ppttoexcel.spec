@@ -5,7 +5,7 @@ a = Analysis(
     ['ppttoexcel2.py'],
     pathex=[],
     binaries=[],
-    datas=[('pptGuide2.ui', '.'), ('logger.py', '.')],
+    datas=[('pptGuide2.ui', '.'), ('logger.py', '.'), ('tagging_schema.json', '.')],
     hiddenimports=[
         'PyQt5.sip',
         'openpyxl.styles',
@@ -1,34 +1,44 @@
 from typing import List, Dict
-from logger import Logger  # Logger 클래스 import
+from logger import Logger, LogModel, LOG_FILTERS  # Logger 클래스 import
+from extraction_engine import ExtractionEngine
+from deck_extractor import load_presentation, extract_deep_records
+from tag_workbook import write_tagging_workbook, report_path_for
+from tag_schema import default_schema, SchemaError
+from progress_tracker import format_eta
+from isolated_runner import IsolatedPool, DEFAULT_TIMEOUT, DEFAULT_MEMORY_MB
 from PyQt5 import QtWidgets, uic
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 from PyQt5.QtCore import QThread, pyqtSignal, QEventLoop, Qt, QTimer
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from pptx import Presentation
 from PyQt5.QtWidgets import QApplication
 from datetime import datetime
 
 import sys
 import traceback
+import multiprocessing
 import os
-import re
 import pandas as pd
 
-#pyinstaller -F --noconsole --clean --add-data "pptGuide.ui;." --add-data "logger.py;." --icon="logo.ico" --name "ppttoexcelV2" ppttoexcel2.py
+# 덱 하나당 처리 한도
+DECK_TIMEOUT = DEFAULT_TIMEOUT       # 초
+DECK_MEMORY_MB = DEFAULT_MEMORY_MB
+
+#pyinstaller -F --noconsole --clean --add-data "pptGuide.ui;." --add-data "logger.py;." --add-data "tagging_schema.json;." --icon="logo.ico" --name "ppttoexcelV2" ppttoexcel2.py
 
 
 class PPTDataExtractor(QThread):
     # 시그널 정의
     progress_updated = pyqtSignal(int)
+    eta_updated = pyqtSignal(float)  # 남은 시간(초)
     log_message = pyqtSignal(str, str)
     extraction_completed = pyqtSignal(str)
     extraction_error = pyqtSignal(str)
 
-    def __init__(self, ppt_path, logger):
+    def __init__(self, ppt_path, logger, isolated=True):
         super().__init__()
         self.ppt_path = ppt_path
         self.logger = logger
+        self.isolated = isolated
+        self.engine = None  # 테이블 추출에 쓴 엔진 (딥 스캔에서 이미 처리한 테이블 제외)
         self.excel_output_path = os.path.join(
             os.path.dirname(self.ppt_path),
             f"{os.path.splitext(os.path.basename(self.ppt_path))[0]}_tagging.xlsx"
@@ -40,12 +50,18 @@ class PPTDataExtractor(QThread):
             self.start_time = datetime.now()
             self.log_message.emit(f"시작: {self.start_time.strftime('%Y년 %m월 %d일 %H시 %M분 %S초')}", "info")
             
-            # PPT 파일 로드
-            presentation = Presentation(self.ppt_path)
-            self.log_message.emit(f"PPT 파일 로드 완료. 총 {len(presentation.slides)}개 슬라이드", "info")
-            
-            # 테이블 데이터 추출
-            table_data = self.extract_table_data(presentation)
+            if self.isolated:
+                # 별도 워커 프로세스에서 추출 (시간/메모리 한도 초과 시 워커만 종료)
+                table_data = self.extract_isolated()
+            else:
+                # PPT 파일 로드 (레거시 .ppt는 .pptx로 변환, 내용 해시 캐시 사용)
+                presentation, _ = load_presentation(self.ppt_path, self.log_message.emit)
+                
+                # 테이블 데이터 추출
+                table_data = self.extract_table_data(presentation)
+                
+                # 그룹 도형/텍스트 상자/노트의 태깅 데이터 추출
+                table_data.extend(self.extract_deep_data(presentation))
             
             if not table_data:
                 self.log_message.emit("추출된 데이터가 없습니다.", "warning")
@@ -108,244 +124,45 @@ class PPTDataExtractor(QThread):
             self.log_message.emit(f"PPT 변환 오류: {str(e)}", "error")
             self.extraction_error.emit(str(e))
 
-    def extract_table_data(self, presentation) -> List[Dict]:
-        table_data = []
-        total_slides = len(presentation.slides)
-        
-        for slide_idx, slide in enumerate(presentation.slides):
-            progress = int((slide_idx + 1) / total_slides * 90)
-            self.progress_updated.emit(progress)
-            
-            # 슬라이드 제목 추출
-            slide_title = self.extract_slide_title(slide)
-            self.log_message.emit(f"슬라이드 {slide_idx + 1}: {slide_title}", "info")
-            
-            # 테이블 찾기 및 데이터 추출
-            for shape in slide.shapes:
-                if hasattr(shape, 'has_table') and shape.has_table:
-                    table = shape.table
-                    
-                    # 테이블이 태깅 가이드 형식인지 확인
-                    if self.is_tagging_guide_table(table):
-                        extracted_data = self.extract_tagging_data(table, slide_idx + 1, slide_title)
-                        table_data.extend(extracted_data)
-                        self.log_message.emit(f"  - {len(extracted_data)}개 태깅 데이터 추출", "success")
-        
-        return table_data
-
-    def extract_slide_title(self, slide):
-        #슬라이드 제목 추출#
-        try:
-            # 제목 플레이스홀더 확인
-            if hasattr(slide.shapes, 'title') and slide.shapes.title:
-                return slide.shapes.title.text.strip()
-            
-            # 상단의 텍스트 박스 찾기
-            for shape in slide.shapes:
-                if hasattr(shape, 'text_frame') and shape.text_frame:
-                    if hasattr(shape, 'top') and shape.top.pt < 100:  # 상단 100pt 이내
-                        text = shape.text.strip()
-                        if text:
-                            return text
-            
-            return "제목 없음"
-        except:
-            return "제목 없음"
-
-    def is_tagging_guide_table(self, table):
-        #태깅 가이드 테이블인지 확인#
-        try:
-            # 첫 번째 행에서 'No' 또는 'Tagging Source' 확인
-            if len(table.rows) > 0:
-                first_row_text = " ".join(cell.text.strip().lower() for cell in table.rows[0].cells)
-                return ('no.' in first_row_text or 'no' in first_row_text) and 'tagging' in first_row_text
-            return False
-        except:
-            return False
-
-    def extract_tagging_data(self, table, slide_num, slide_title):
-        #테이블에서 태깅 데이터 추출#
-        extracted_data = []
-        
-        try:
-            # 모든 행 데이터 수집
-            all_rows = []
-            for row_idx, row in enumerate(table.rows):
-                row_data = []
-                for cell in row.cells:
-                    row_data.append(cell.text.strip() if cell.text else "")
-                all_rows.append(row_data)
-            
-            # 헤더 행 건너뛰기
-            data_start_idx = 0
-            for idx, row in enumerate(all_rows):
-                if any('tagging' in cell.lower() for cell in row):
-                    data_start_idx = idx + 1
-                    break
-            
-            # 데이터 행 처리
-            current_no = None
-            current_group_data = []
-            
-            for row_idx in range(data_start_idx, len(all_rows)):
-                row = all_rows[row_idx]
-                if not any(row):  # 빈 행
-                    continue
-                
-                # No 확인 (첫 번째 열)
-                first_cell = row[0] if row else ""
-                
-                # 새로운 No 그룹 시작
-                if first_cell.isdigit():
-                    # 이전 그룹 처리
-                    if current_no and current_group_data:
-                        extracted_data.extend(self.process_group_data(
-                            current_no, current_group_data, slide_num, slide_title
-                        ))
-                    
-                    # 새 그룹 시작
-                    current_no = int(first_cell)
-                    current_group_data = [row]
-                
-                # 현재 그룹에 행 추가
-                elif current_no is not None:
-                    current_group_data.append(row)
-            
-            # 마지막 그룹 처리
-            if current_no and current_group_data:
-                extracted_data.extend(self.process_group_data(
-                    current_no, current_group_data, slide_num, slide_title
-                ))
-            
-        except Exception as e:
-            self.log_message.emit(f"테이블 데이터 추출 오류: {str(e)}", "error")
-        
-        return extracted_data
-
-    def process_group_data(self, no, group_rows, slide_num, slide_title):
-        #No 그룹의 데이터 처리#
-        results = []
-        
-        # Action 찾기
-        actions = []
-        for row in group_rows:
-            for cell in row[1:]:  # 첫 번째 열(No) 제외
-                if cell and not any(tag in cell for tag in ['AA', 'GA', 'data-omni', 'ga-']):
-                    # Action 키워드 체크
-                    if any(keyword in cell.lower() for keyword in 
-                          ['click', 'buy', 'order', 'reserve', 'open', 'close', 'drop', 'where', 'pre-order']) or \
-                       (len(cell) > 5 and '=' not in cell and cell not in ['　', '']):
-                        actions.append(cell)
-        
-        # 각 Action에 대한 태깅 정보 찾기
-        if not actions:  # Action이 없으면 전체를 하나의 항목으로 처리
-            actions = ['']
-        
-        for action in actions:
-            result = {
-                'No': no,
-                'Slide': slide_num,
-                'Title': slide_title,
-                'Action': action
-            }
-            
-            # 모든 행에서 태깅 정보 추출
-            all_text = " ".join(" ".join(row) for row in group_rows)
-            
-            # 태깅 속성 추출
-            tagging_attrs = self.extract_tagging_attributes(all_text)
-            result.update(tagging_attrs)
-            
-            # Action별로 개별 태깅이 있는 경우 처리
-            if action:
-                for row in group_rows:
-                    row_text = " ".join(row)
-                    if action in row_text:
-                        # 해당 Action이 있는 행 주변의 태깅 정보 추출
-                        specific_attrs = self.extract_tagging_attributes(row_text)
-                        if specific_attrs:
-                            result.update(specific_attrs)
-            
-            results.append(result)
-        
-        return results
+    def extract_isolated(self) -> List[Dict]:
+        #워커 프로세스에서 덱 추출 - 한도 초과/비정상 종료는 오류로 보고#
+        with IsolatedPool(workers=1, timeout=DECK_TIMEOUT, memory_mb=DECK_MEMORY_MB) as pool:
+            result = pool.run_one(
+                self.ppt_path,
+                on_log=self.log_message.emit,
+                on_progress=self.progress_updated.emit,
+                on_eta=self.eta_updated.emit
+            )
+        if not result.ok:
+            raise RuntimeError(result.message)
+        return result.records
 
-    def extract_tagging_attributes(self, text):
-        #텍스트에서 태깅 속성 추출#
-        attributes = {}
-        
-        # 텍스트 정리
-        text = re.sub(r'""', '"', text)  # 이중 따옴표 처리
-        text = re.sub(r'“', '"', text)   # 특수 따옴표 처리
-        text = re.sub(r'”', '"', text)
-        text = re.sub(r'"', '"', text)   # 추가 특수 따옴표 처리
+    def extract_table_data(self, presentation) -> List[Dict]:
+        #테이블별로 파싱 전략을 골라 태깅 데이터 추출#
+        self.engine = ExtractionEngine(
+            log=self.log_message.emit,
+            progress=self.progress_updated.emit,
+            eta=self.eta_updated.emit
+        )
+        return self.engine.extract(presentation)
 
-        # 패턴 매칭
-        patterns = {
-            'data-omni-type': r'data-omni-type\s*=\s*"([^"]+)"',
-            'data-omni': r'data-omni\s*=\s*"([^"]+)"',
-            'ga-ca': r'ga-ca\s*=\s*"([^"]+)"',
-            'ga-ac': r'ga-ac\s*=\s*"([^"]+)"',
-            'ga-la': r'ga-la\s*=\s*"([^"]+)"'
-        }
-        
-        for key, pattern in patterns.items():
-            match = re.search(pattern, text)
-            if match:
-                value = match.group(1).strip()
-                # 잘못된 값 정리
-                if key == 'data-omni-type':
-                    value = value.replace('" data-omni=', '')
-                attributes[key] = value
-        
-        return attributes
+    def extract_deep_data(self, presentation) -> List[Dict]:
+        #태깅 테이블로 처리되지 않은 곳(그룹 도형, 텍스트 상자, 기타 테이블, 노트)의 태깅 데이터 추출#
+        return extract_deep_records(presentation, self.engine, log=self.log_message.emit)
 
     def save_to_excel(self, table_data):
-        #데이터를 엑셀로 저장#
+        #데이터를 엑셀로 저장 (태깅 데이터 + Validation 시트, 검증 리포트 JSON)#
         try:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = '태깅 데이터'
-            
-            # 헤더 설정
-            headers = ['No', 'Slide', 'Title', 'Action', 'data-omni-type', 'data-omni', 'ga-ca', 'ga-ac', 'ga-la']
-            
-            # 헤더 스타일
-            header_font = Font(bold=True)
-            header_fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
-            header_alignment = Alignment(horizontal="center", vertical="center")
-            
-            # 헤더 작성 (5행, D열부터)
-            start_row = 5
-            start_col = 4  # D열
-            
-            for col_idx, header in enumerate(headers):
-                cell = ws.cell(row=start_row, column=start_col + col_idx, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
+            report = write_tagging_workbook(self.excel_output_path, table_data)
+            self.log_message.emit(f"엑셀 파일 저장 완료: {self.excel_output_path}", "success")
             
-            # 데이터 작성
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
+            level = "warning" if report['error_count'] else "success"
+            self.log_message.emit(
+                f"검증 완료: 오류 {report['error_count']}건, 경고 {report['warning_count']}건 "
+                f"({os.path.basename(report_path_for(self.excel_output_path))})",
+                level
             )
             
-            for row_idx, data in enumerate(table_data, start=start_row + 1):
-                for col_idx, header in enumerate(headers):
-                    cell = ws.cell(
-                        row=row_idx,
-                        column=start_col + col_idx,
-                        value=data.get(header, '')
-                    )
-                    cell.border = thin_border
-            
-            # 파일 저장
-            wb.save(self.excel_output_path)
-            self.log_message.emit(f"엑셀 파일 저장 완료: {self.excel_output_path}", "success")
-            
         except Exception as e:
             self.log_message.emit(f"엑셀 저장 오류: {str(e)}", "error")
             raise
@@ -367,9 +184,24 @@ class PPTConverterApp(QtWidgets.QMainWindow):
         # 초기 설정
         self.ppt_file_path = ""
         
+        # 로그 모델/뷰 (보이는 행만 그림)
+        self.log_model = LogModel(self)
+        self.logListView.setModel(self.log_model)
+        for label, _ in LOG_FILTERS:
+            self.logFilterCombo.addItem(label)
+        self.logFilterCombo.currentIndexChanged.connect(self.apply_log_filter)
+        
+        # 검색어 입력은 잠시 멈췄을 때 한 번만 적용
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(200)
+        self.search_timer.timeout.connect(self.apply_log_filter)
+        self.logSearchEdit.textChanged.connect(lambda _: self.search_timer.start())
+        
         # Logger 초기화
-        self.logger = Logger(self.logTextEdit)
-        self.logger.log_signal.connect(self.logTextEdit.insertHtml)
+        self.logger = Logger(self.log_model)
+        self.logger.log_signal.connect(self.log_model.append)
+        self.log_model.rowsInserted.connect(self.scroll_log_to_bottom)
         
         # 초기 로그 메시지
         self.logger.log("Unpack Tagging Guide.", "info")
@@ -411,12 +243,14 @@ class PPTConverterApp(QtWidgets.QMainWindow):
         self.logger.log("PPT 변환을 시작합니다...", "normal")
         self.convertBtn.setEnabled(False)
         self.progressBar.setValue(0)
+        self.progressBar.setFormat("%p%")
         
         # 데이터 추출기 생성
         self.extractor = PPTDataExtractor(self.ppt_file_path, self.logger)
         
         # 시그널 연결
         self.extractor.progress_updated.connect(self.update_progress)
+        self.extractor.eta_updated.connect(self.update_eta)
         self.extractor.log_message.connect(self.handle_log_message)
         self.extractor.extraction_completed.connect(self.conversion_finished)
         self.extractor.extraction_error.connect(self.conversion_error)
@@ -434,26 +268,27 @@ class PPTConverterApp(QtWidgets.QMainWindow):
     def handle_log_message(self, message, msg_type):
         #로그 메시지 처리#
         self.logger.log(message, msg_type)
-        self.scroll_log_to_bottom()
     
     def update_progress(self, value):
         #진행률 업데이트#
         self.progressBar.setValue(value)
-        self.scroll_log_to_bottom()
+    
+    def update_eta(self, seconds):
+        #남은 시간 표시 (진행률 막대 텍스트)#
+        self.progressBar.setFormat(f"%p% (남은 시간 약 {format_eta(seconds)})")
     
     def scroll_log_to_bottom(self):
         #로그 스크롤을 맨 아래로#
-        scrollbar = self.logTextEdit.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self.logListView.scrollToBottom()
     
     def process_events(self):
         #주기적으로 이벤트 처리#
         QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
-        self.scroll_log_to_bottom()
     
     def conversion_finished(self, excel_path):
         #변환 완료 처리#
         self.convertBtn.setEnabled(True)
+        self.progressBar.setFormat("%p%")
         
         if self.update_timer:
             self.update_timer.stop()
@@ -481,6 +316,7 @@ class PPTConverterApp(QtWidgets.QMainWindow):
     def conversion_error(self, error_msg):
         #변환 오류 처리#
         self.convertBtn.setEnabled(True)
+        self.progressBar.setFormat("%p%")
         
         if self.update_timer:
             self.update_timer.stop()
@@ -489,13 +325,24 @@ class PPTConverterApp(QtWidgets.QMainWindow):
     
     def clear_log(self):
         #로그 지우기#
-        self.logTextEdit.clear()
+        self.log_model.clear()
         self.logger.log("로그가 지워졌습니다.", "info")
+    
+    def apply_log_filter(self):
+        #로그 타입 필터/검색 적용#
+        _, types = LOG_FILTERS[max(0, self.logFilterCombo.currentIndex())]
+        self.log_model.set_filter(types, self.logSearchEdit.text())
 
 
 def main():
     try:
         app = QtWidgets.QApplication(sys.argv)
+        # 태깅 스키마는 여기서 처음 로드 (TAGGING_SCHEMA가 잘못되면 알리고 충돌 로그로)
+        try:
+            default_schema()
+        except SchemaError as e:
+            QMessageBox.critical(None, "태깅 스키마 오류", str(e))
+            raise
         window = PPTConverterApp()
         window.show()
         sys.exit(app.exec_())
@@ -521,4 +368,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 워커 프로세스 지원
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,238 @@
+from typing import List, Dict, Optional, Iterator, Tuple
+
+import os
+import mmap
+import zlib
+import struct
+import posixpath
+
+from lxml import etree
+
+# .pptx(zip) 패키지를 mmap 한 번으로 읽는 리더
+# - 중앙 디렉터리만 인덱싱하고 파트는 요청 시에만 압축 해제
+# - 무압축(stored) 파트는 memoryview 슬라이스를 그대로 반환 (복사 없음)
+# - 같은 파일을 여러 프로세스가 열어도 OS 페이지 캐시를 공유
+# - 이미 읽어 둔 파일 내용(bytes)도 같은 방식으로 인덱싱 가능 (MappedPackage(path, data))
+
+EOCD_SIGNATURE = b'PK\x05\x06'
+ZIP64_LOCATOR_SIGNATURE = b'PK\x06\x07'
+CENTRAL_SIGNATURE = 0x02014b50
+LOCAL_SIGNATURE = 0x04034b50
+
+STORED = 0
+DEFLATED = 8
+
+NS_PML = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+NS_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+NS_PKG_REL = 'http://schemas.openxmlformats.org/package/2006/relationships'
+RT_NOTES_SLIDE = NS_REL + '/notesSlide'
+
+
+class PackageError(Exception):
+    pass
+
+
+class ZipEntry:
+    __slots__ = ('name', 'method', 'compressed_size', 'size', 'header_offset', '_data_offset')
+
+    def __init__(self, name, method, compressed_size, size, header_offset):
+        self.name = name
+        self.method = method
+        self.compressed_size = compressed_size
+        self.size = size
+        self.header_offset = header_offset
+        self._data_offset = None
+
+
+class MappedPackage:
+    def __init__(self, path, data=None):
+        # data: 이미 메모리에 읽어 둔 파일 내용 (있으면 디스크를 다시 열지 않음)
+        self.path = path
+        self._file = None
+        if data is not None:
+            if not data:
+                raise PackageError(f"빈 파일입니다: {os.path.basename(path)}")
+            self._map = data
+        else:
+            self._file = open(path, 'rb')
+            try:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                self._file.close()
+                raise PackageError(f"빈 파일입니다: {os.path.basename(path)}")
+        self._view = memoryview(self._map)
+        self.entries: Dict[str, ZipEntry] = {}
+        self._rels_cache: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        try:
+            self._index()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if isinstance(self._map, mmap.mmap):
+            try:
+                self._map.close()
+            except BufferError:
+                # 호출자가 아직 slice를 들고 있으면 마지막 참조가 사라질 때 해제됨
+                pass
+        self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ---- zip 중앙 디렉터리 ----
+
+    def _index(self):
+        #End of Central Directory를 찾아 엔트리 인덱스 생성#
+        data = self._map
+        search_start = max(0, len(data) - (0xFFFF + 22))
+        eocd = data.rfind(EOCD_SIGNATURE, search_start)
+        if eocd < 0:
+            raise PackageError(f"zip 형식이 아닙니다: {os.path.basename(self.path)}")
+
+        (_, _, _, _, count, cd_size, cd_offset, _) = struct.unpack_from('<4sHHHHIIH', data, eocd)
+
+        # zip64
+        if cd_offset == 0xFFFFFFFF or cd_size == 0xFFFFFFFF or count == 0xFFFF:
+            locator = eocd - 20
+            if locator < 0 or data[locator:locator + 4] != ZIP64_LOCATOR_SIGNATURE:
+                raise PackageError("zip64 중앙 디렉터리를 찾을 수 없습니다.")
+            (zip64_eocd,) = struct.unpack_from('<Q', data, locator + 8)
+            count, cd_size, cd_offset = struct.unpack_from('<QQQ', data, zip64_eocd + 32)
+
+        cd_end = cd_offset + cd_size
+        if cd_end > len(data):
+            raise PackageError(f"잘린 zip 파일입니다: {os.path.basename(self.path)}")
+
+        view = self._view
+        pos = cd_offset
+        for _ in range(count):
+            if pos + 46 > cd_end:
+                raise PackageError("손상된 중앙 디렉터리입니다.")
+            (signature, _, _, flags, method, _, _, _, csize, usize,
+             name_len, extra_len, comment_len, _, _, _, offset) = struct.unpack_from('<IHHHHHHIIIHHHHHII', view, pos)
+            if signature != CENTRAL_SIGNATURE:
+                raise PackageError("손상된 중앙 디렉터리입니다.")
+            name_start = pos + 46
+            raw_name = bytes(view[name_start:name_start + name_len])
+            name = raw_name.decode('utf-8' if flags & 0x800 else 'cp437')
+
+            if csize == 0xFFFFFFFF or usize == 0xFFFFFFFF or offset == 0xFFFFFFFF:
+                usize, csize, offset = self._zip64_extra(
+                    view[name_start + name_len:name_start + name_len + extra_len], usize, csize, offset)
+
+            self.entries[name] = ZipEntry(name, method, csize, usize, offset)
+            pos = name_start + name_len + extra_len + comment_len
+
+    @staticmethod
+    def _zip64_extra(extra, usize, csize, offset):
+        pos = 0
+        while pos + 4 <= len(extra):
+            tag, size = struct.unpack_from('<HH', extra, pos)
+            if tag == 0x0001:
+                fields = pos + 4
+                if usize == 0xFFFFFFFF:
+                    (usize,) = struct.unpack_from('<Q', extra, fields)
+                    fields += 8
+                if csize == 0xFFFFFFFF:
+                    (csize,) = struct.unpack_from('<Q', extra, fields)
+                    fields += 8
+                if offset == 0xFFFFFFFF:
+                    (offset,) = struct.unpack_from('<Q', extra, fields)
+                break
+            pos += 4 + size
+        return usize, csize, offset
+
+    def _data_offset(self, entry):
+        #로컬 헤더 뒤 실제 데이터 위치 (처음 접근 시 계산)#
+        if entry._data_offset is None:
+            (signature, _, _, _, _, _, _, _, _, name_len, extra_len) = \
+                struct.unpack_from('<IHHHHHIIIHH', self._view, entry.header_offset)
+            if signature != LOCAL_SIGNATURE:
+                raise PackageError(f"손상된 로컬 헤더: {entry.name}")
+            entry._data_offset = entry.header_offset + 30 + name_len + extra_len
+        return entry._data_offset
+
+    # ---- 파트 접근 ----
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def raw(self, name) -> memoryview:
+        #압축된 상태 그대로의 데이터 슬라이스#
+        entry = self.entries[name]
+        start = self._data_offset(entry)
+        return self._view[start:start + entry.compressed_size]
+
+    def read(self, name):
+        #파트 내용 - stored면 memoryview(복사 없음), deflate면 해제된 bytes#
+        entry = self.entries[name]
+        data = self.raw(name)
+        if entry.method == STORED:
+            return data
+        if entry.method == DEFLATED:
+            return zlib.decompressobj(-15).decompress(data)
+        raise PackageError(f"지원하지 않는 압축 방식({entry.method}): {name}")
+
+    def parse_part(self, name):
+        #파트 XML을 lxml로 파싱#
+        return etree.fromstring(self.read(name))
+
+    # ---- OPC 관계 ----
+
+    @staticmethod
+    def rels_name(part_name):
+        directory, filename = posixpath.split(part_name)
+        return posixpath.join(directory, '_rels', filename + '.rels')
+
+    def relationships(self, part_name) -> Dict[str, Tuple[str, str]]:
+        #rId -> (관계 유형, 대상 파트 이름)#
+        cached = self._rels_cache.get(part_name)
+        if cached is not None:
+            return cached
+
+        rels = {}
+        rels_name = self.rels_name(part_name)
+        if rels_name in self.entries:
+            base = posixpath.dirname(part_name)
+            for rel in self.parse_part(rels_name).iterfind(f'{{{NS_PKG_REL}}}Relationship'):
+                if rel.get('TargetMode') == 'External':
+                    continue
+                target = rel.get('Target', '')
+                target = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join(base, target))
+                rels[rel.get('Id')] = (rel.get('Type'), target)
+        self._rels_cache[part_name] = rels
+        return rels
+
+    def slide_part_names(self) -> List[str]:
+        #presentation.xml의 sldIdLst 순서대로 슬라이드 파트 이름#
+        presentation = 'ppt/presentation.xml'
+        rels = self.relationships(presentation)
+        root = self.parse_part(presentation)
+        names = []
+        for sld_id in root.iterfind(f'{{{NS_PML}}}sldIdLst/{{{NS_PML}}}sldId'):
+            rel = rels.get(sld_id.get(f'{{{NS_REL}}}id'))
+            if rel and rel[1] in self.entries:
+                names.append(rel[1])
+        return names
+
+    def notes_part_name(self, slide_part_name) -> Optional[str]:
+        for rel_type, target in self.relationships(slide_part_name).values():
+            if rel_type == RT_NOTES_SLIDE and target in self.entries:
+                return target
+        return None
+
+    def iter_slides(self) -> Iterator[Tuple[int, str, object]]:
+        #(슬라이드 번호, 파트 이름, XML 데이터) - 필요한 슬라이드 파트만 해제#
+        for slide_num, name in enumerate(self.slide_part_names(), 1):
+            yield slide_num, name, self.read(name)
@@ -0,0 +1,103 @@
+from typing import List, Optional, Callable
+
+import time
+
+from lxml import etree
+
+# 작업량 기준 진행률 / 남은 시간 추정
+# - 추출 전에 슬라이드 XML에서 테이블/행 수만 세어 슬라이드별 가중치 계산 (텍스트는 헤더 행 문자열만)
+#   * 슬라이드 기본 비용 1 + 태깅 테이블 행 수 (태깅 테이블이 아니면 헤더 행 1개만 읽으므로 1)
+# - 처리한 가중치(행)/초로 남은 시간 계산
+# - 갱신은 일정 간격으로만 전달 (진행률 값이 바뀌었을 때만, 마지막 값은 항상)
+
+NS_A = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+NS_P = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+
+NAMESPACES = {'a': NS_A, 'p': NS_P}
+
+# 최상위 테이블만 (그룹 안 테이블은 ExtractionEngine이 처리하지 않음)
+TOP_TABLES = etree.XPath('p:cSld/p:spTree/p:graphicFrame/a:graphic/a:graphicData/a:tbl', namespaces=NAMESPACES)
+# 요소 프록시 객체를 만들지 않도록 XPath로 문자열/개수만 얻음
+HEADER_TEXT = etree.XPath('string(a:tr[1])', namespaces=NAMESPACES)
+ROW_COUNT = etree.XPath('count(a:tr)', namespaces=NAMESPACES)
+
+SLIDE_COST = 1
+PROGRESS_INTERVAL = 0.1  # 초 (최대 초당 10회)
+ETA_MIN_SECONDS = 0.5    # 이보다 짧게 측정된 처리 속도로는 남은 시간을 알리지 않음
+
+
+def slide_weight(slide_element, may_match=None) -> int:
+    #최상위 테이블 행 수 기반 슬라이드 작업량 (may_match: 헤더 행 텍스트 -> 태깅 테이블일 수 있는지)#
+    weight = SLIDE_COST
+    for tbl in TOP_TABLES(slide_element):
+        if may_match is not None and not may_match(HEADER_TEXT(tbl)):
+            # 태깅 테이블이 아니면 헤더 행만 읽음
+            weight += 1
+        else:
+            weight += int(ROW_COUNT(tbl))
+    return weight
+
+
+def presentation_weights(presentation, may_match=None) -> List[int]:
+    #슬라이드별 작업량 (python-pptx가 이미 파싱한 XML 트리 사용)#
+    return [slide_weight(slide._element, may_match) for slide in presentation.slides]
+
+
+def format_eta(seconds) -> str:
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}초"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}분 {seconds}초"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}시간 {minutes}분"
+
+
+class ProgressTracker:
+    def __init__(self, weights: List[int], progress: Optional[Callable[[int], None]] = None,
+                 eta: Optional[Callable[[float], None]] = None, start=0, end=90,
+                 interval=PROGRESS_INTERVAL, clock=time.perf_counter):
+        # progress: 진행률(start~end 정수), eta: 남은 시간(초)
+        self.weights = weights
+        self.total = sum(weights) or 1
+        self.progress = progress
+        self.eta = eta
+        self.start = start
+        self.end = end
+        self.interval = interval
+        self.clock = clock
+        self.done = 0
+        self.started = clock()
+        self._last_emit = None
+        self._last_value = None
+
+    @property
+    def rate(self) -> float:
+        #측정된 처리 속도 (가중치/초)#
+        elapsed = self.clock() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def remaining_seconds(self) -> Optional[float]:
+        elapsed = self.clock() - self.started
+        if self.done <= 0 or elapsed < ETA_MIN_SECONDS:
+            return None
+        return (self.total - self.done) * elapsed / self.done
+
+    def advance(self, idx):
+        #idx번째 단위(슬라이드) 처리 완료#
+        self.done += self.weights[idx]
+        value = self.start + int((self.end - self.start) * min(self.done, self.total) / self.total)
+        if value == self._last_value:
+            return
+        now = self.clock()
+        if value != self.end and self._last_emit is not None and now - self._last_emit < self.interval:
+            return
+        self._last_emit = now
+        self._last_value = value
+        if self.progress:
+            self.progress(value)
+        if self.eta:
+            remaining = self.remaining_seconds()
+            if remaining is not None:
+                self.eta(remaining)
@@ -0,0 +1,87 @@
+from typing import List, Dict
+
+NO_TITLE = "제목 없음"
+TOP_THRESHOLD_PT = 100  # 상단 100pt 이내 텍스트를 제목 후보로 간주
+
+
+class SlideScan:
+    #슬라이드 도형을 한 번만 순회하여 제목 플레이스홀더 / 상단 텍스트 / 테이블로 분류#
+    __slots__ = ('slide_num', 'title_shape', 'top_text_shapes', 'tables', '_title')
+
+    def __init__(self, slide_num):
+        self.slide_num = slide_num
+        self.title_shape = None
+        self.top_text_shapes = []
+        self.tables = []
+        self._title = None
+
+    @property
+    def title(self) -> str:
+        #제목은 처음 요청될 때 한 번만 계산 (레코드가 나온 슬라이드만 비용 발생)#
+        if self._title is None:
+            self._title = self._resolve_title()
+        return self._title
+
+    def _resolve_title(self) -> str:
+        try:
+            # 제목 플레이스홀더 우선
+            if self.title_shape is not None:
+                return self.title_shape.text.strip()
+
+            # 상단의 텍스트 박스 (문서 순서)
+            for shape in self.top_text_shapes:
+                text = shape.text.strip()
+                if text:
+                    return text
+
+            return NO_TITLE
+        except Exception:
+            return NO_TITLE
+
+
+class SlideScanner:
+    #슬라이드 스캐너 - 레이아웃별 제목 플레이스홀더 유무를 캐시#
+
+    def __init__(self, top_threshold=TOP_THRESHOLD_PT):
+        self.top_threshold = top_threshold
+        # 레이아웃 partname -> 제목 플레이스홀더(idx 0) 보유 여부
+        self._layout_has_title: Dict[str, bool] = {}
+
+    def layout_has_title(self, slide) -> bool:
+        #동일 레이아웃을 쓰는 슬라이드는 제목 플레이스홀더 검사 결과를 재사용#
+        try:
+            layout = slide.slide_layout
+        except Exception:
+            return True
+        key = str(layout.part.partname)
+        cached = self._layout_has_title.get(key)
+        if cached is None:
+            cached = any(elm.ph_idx == 0 for elm in layout.shapes._spTree.iter_ph_elms())
+            self._layout_has_title[key] = cached
+        return cached
+
+    def scan(self, slide, slide_num) -> SlideScan:
+        #도형을 한 번만 순회하면서 분류 (텍스트는 읽지 않음)#
+        result = SlideScan(slide_num)
+        check_title = self.layout_has_title(slide)
+        threshold = self.top_threshold
+
+        for shape in slide.shapes:
+            if shape.has_table:
+                result.tables.append(shape.table)
+                continue
+
+            if check_title and result.title_shape is None and shape.is_placeholder:
+                if shape._element.ph_idx == 0:
+                    result.title_shape = shape
+                    continue
+
+            if shape.has_text_frame:
+                top = shape.top
+                if top is not None and top.pt < threshold:
+                    result.top_text_shapes.append(shape)
+
+        return result
+
+    def scan_presentation(self, presentation) -> List[SlideScan]:
+        return [self.scan(slide, idx) for idx, slide in enumerate(presentation.slides, 1)]
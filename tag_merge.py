@@ -0,0 +1,437 @@
+from typing import List, Dict, Iterator, Tuple
+
+import os
+import sys
+import pickle
+import shutil
+import heapq
+import hashlib
+import argparse
+import tempfile
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+from tag_schema import default_schema
+from tag_shards import write_shard_stream, SPLIT_MODES
+
+# 여러 덱의 태깅 레코드를 속성 조합 기준으로 중복 제거/통합
+# - 키: 태깅 스키마의 속성 값 조합 (data-omni-type, data-omni, ga-ca, ga-ac, ga-la) 해시
+# - 값: 출현 수, 덱 집합, 출현 위치 (덱, 슬라이드, No) 목록 (태그당 max_sources개까지만 보관)
+# - 메모리 한도를 넘으면 해시 파티션 파일로 내보내고 마지막에 파티션별로 병합
+#   (병합 시 한도를 넘는 파티션은 다음 해시 바이트로 다시 나눠서 한 번에 올라가는 양 제한)
+# - 파티션별 병합 결과는 처음 나온 순서(SEQUENCE)로 정렬해서 파일로 두고 힙으로 합쳐서 출력
+#   (내보냈는지와 관계없이 처음 나온 순서)
+#
+#   python tag_merge.py <pptx 파일 또는 폴더> [...] -o merged.xlsx
+#   python tag_merge.py <...> -o merged.parquet   (pyarrow 필요)
+#   python tag_merge.py <...> -o merged.xlsx --shard-by ga-ca [--split files]   (ga-ca별 시트/파일 + Index)
+
+MERGED_COLUMNS = ['Count', 'Decks', 'Sources']
+
+EXCEL_MAX_ROWS = 1048576
+EXCEL_MAX_CELL = 32767
+DEFAULT_MAX_SOURCES = 1000
+RUN_CHUNK_ENTRIES = 1000
+
+# entry 필드
+SEQUENCE, VALUES, COUNT, DECKS, SOURCES, EXTRA = range(6)
+
+
+def attribute_keys() -> List[str]:
+    #태깅 스키마의 속성 이름 (import 시점이 아니라 처음 쓸 때 스키마 로드)#
+    return list(default_schema().attributes)
+
+
+def merged_headers() -> List[str]:
+    return attribute_keys() + MERGED_COLUMNS
+
+
+def tag_key(record, keys=None) -> Tuple[str, ...]:
+    return tuple((record.get(key) or '').strip() for key in (keys or attribute_keys()))
+
+
+def key_digest(values) -> bytes:
+    return hashlib.blake2b('\x1f'.join(values).encode('utf-8'), digest_size=16).digest()
+
+
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("Parquet 저장에는 pyarrow가 필요합니다. (pip install pyarrow)")
+    return pyarrow, pyarrow.parquet
+
+
+def _merge_entry(target, entry, max_sources):
+    #같은 태그의 entry를 target에 합침 (출현 위치는 max_sources개까지만)#
+    target[SEQUENCE] = min(target[SEQUENCE], entry[SEQUENCE])
+    target[COUNT] += entry[COUNT]
+    target[DECKS] |= entry[DECKS]
+    target[EXTRA] += entry[EXTRA]
+    sources = target[SOURCES]
+    for occurrence in entry[SOURCES]:
+        if occurrence in sources:
+            continue
+        if len(sources) < max_sources:
+            sources[occurrence] = None
+        else:
+            target[EXTRA] += 1
+
+
+def _entry_rows(entry) -> int:
+    #메모리 한도 계산용 entry 크기 (태그 1 + 보관 중인 출현 위치 수)#
+    return 1 + len(entry[SOURCES])
+
+
+class TagMerger:
+    def __init__(self, spill_dir=None, max_memory_rows=500000, partitions=64, max_sources=DEFAULT_MAX_SOURCES):
+        # max_memory_rows: 메모리에 들고 있을 최대 출현 수 (넘으면 디스크로 내보냄)
+        # max_sources: 태그당 보관할 출현 위치 수 (나머지는 개수만 셈)
+        self.max_memory_rows = max_memory_rows
+        self.partitions = partitions
+        self.max_sources = max_sources
+        self.attribute_keys = attribute_keys()
+        self.headers = self.attribute_keys + MERGED_COLUMNS
+        self.decks: List[str] = []
+        self._deck_index: Dict[str, int] = {}
+        # digest -> [순번, 속성값, 출현 수, 덱 집합, 출현 위치(dict, 순서 유지), 보관하지 않은 출현 수]
+        self._entries: Dict[bytes, list] = {}
+        self._memory_rows = 0
+        self._sequence = 0
+        self._spill_root = spill_dir
+        self._spill_dir = None
+        self._partition_rows: Dict[int, int] = {}
+        self.total_records = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._spill_dir and os.path.isdir(self._spill_dir):
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+        self._spill_dir = None
+
+    @property
+    def spilled(self):
+        return self._spill_dir is not None
+
+    # ---- 입력 ----
+
+    def deck_id(self, deck) -> int:
+        idx = self._deck_index.get(deck)
+        if idx is None:
+            idx = len(self.decks)
+            self.decks.append(deck)
+            self._deck_index[deck] = idx
+        return idx
+
+    def add_records(self, deck, records):
+        #PPTDataExtractor/extract_deck 결과 한 덱 분량 추가#
+        deck_idx = self.deck_id(deck)
+        keys = self.attribute_keys
+        for record in records:
+            values = tag_key(record, keys)
+            if not any(values):
+                continue
+            self.total_records += 1
+            occurrence = (deck_idx, record.get('Slide'), record.get('No'))
+            digest = key_digest(values)
+            # _spill()이 self._entries를 새 dict로 바꾸므로 매번 다시 참조
+            entries = self._entries
+            entry = entries.get(digest)
+            if entry is None:
+                self._sequence += 1
+                entries[digest] = [self._sequence, values, 1, {deck_idx}, {occurrence: None}, 0]
+                self._memory_rows += 2
+            else:
+                entry[COUNT] += 1
+                entry[DECKS].add(deck_idx)
+                sources = entry[SOURCES]
+                if occurrence in sources:
+                    continue
+                if len(sources) >= self.max_sources:
+                    entry[EXTRA] += 1
+                    continue
+                sources[occurrence] = None
+                self._memory_rows += 1
+
+            if self._memory_rows >= self.max_memory_rows:
+                self._spill()
+
+    # ---- 디스크 분할 ----
+
+    def _partition_path(self, idx, prefix="part"):
+        return os.path.join(self._spill_dir, f"{prefix}_{idx:03d}.pkl")
+
+    @staticmethod
+    def _append_partition(path, items):
+        with open(path, 'ab') as f:
+            pickle.dump(items, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _iter_chunks(path) -> Iterator[list]:
+        with open(path, 'rb') as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    return
+
+    def _spill(self):
+        #메모리 내용을 해시 파티션 파일 끝에 추가#
+        if not self._entries:
+            return
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="tag_merge_", dir=self._spill_root)
+
+        buckets: Dict[int, list] = {}
+        for digest, entry in self._entries.items():
+            buckets.setdefault(digest[0] % self.partitions, []).append((digest, entry))
+        for idx, items in buckets.items():
+            self._append_partition(self._partition_path(idx), items)
+            self._partition_rows[idx] = self._partition_rows.get(idx, 0) + sum(_entry_rows(e) for _, e in items)
+
+        self._entries = {}
+        self._memory_rows = 0
+
+    def _read_partition(self, path) -> Dict[bytes, list]:
+        merged: Dict[bytes, list] = {}
+        for items in self._iter_chunks(path):
+            for digest, entry in items:
+                existing = merged.get(digest)
+                if existing is None:
+                    merged[digest] = entry
+                else:
+                    _merge_entry(existing, entry, self.max_sources)
+        return merged
+
+    def _split_partition(self, path, depth) -> List[Tuple[str, int]]:
+        #파티션 파일을 digest[depth] 기준으로 다시 나눔 -> [(경로, 크기)]#
+        prefix = f"{os.path.splitext(os.path.basename(path))[0]}_{depth}"
+        rows: Dict[int, int] = {}
+        for items in self._iter_chunks(path):
+            buckets: Dict[int, list] = {}
+            for digest, entry in items:
+                buckets.setdefault(digest[depth] % self.partitions, []).append((digest, entry))
+            for idx, bucket in buckets.items():
+                self._append_partition(self._partition_path(idx, prefix), bucket)
+                rows[idx] = rows.get(idx, 0) + sum(_entry_rows(entry) for _, entry in bucket)
+        os.remove(path)
+        return [(self._partition_path(idx, prefix), rows[idx]) for idx in sorted(rows)]
+
+    def _sorted_runs(self, path, rows, depth=1) -> List[str]:
+        #파티션 하나를 병합해서 SEQUENCE 순 정렬 파일로 - 한도를 넘으면 다음 해시 바이트로 나눠서 각각#
+        if rows > self.max_memory_rows and depth < 16:
+            runs = []
+            for sub_path, sub_rows in self._split_partition(path, depth):
+                runs.extend(self._sorted_runs(sub_path, sub_rows, depth + 1))
+            return runs
+        entries = sorted(self._read_partition(path).values(), key=lambda entry: entry[SEQUENCE])
+        os.remove(path)
+        run_path = f"{os.path.splitext(path)[0]}_run.pkl"
+        for start in range(0, len(entries), RUN_CHUNK_ENTRIES):
+            self._append_partition(run_path, entries[start:start + RUN_CHUNK_ENTRIES])
+        return [run_path] if entries else []
+
+    @staticmethod
+    def _iter_run(path) -> Iterator[list]:
+        #정렬 파일을 청크 단위로 읽음 (읽을 때만 열어서 동시에 열린 파일 수 제한) - 다 읽으면 삭제#
+        offset = 0
+        while True:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                try:
+                    chunk = pickle.load(f)
+                except EOFError:
+                    break
+                offset = f.tell()
+            yield from chunk
+        os.remove(path)
+
+    # ---- 결과 ----
+
+    def iter_merged(self) -> Iterator[list]:
+        #병합된 entry (처음 나온 순서) - 병합 시 메모리에 올라가는 것은 한 번에 파티션 하나,
+        #출력 시에는 정렬 파일마다 청크 하나
+        #분할 파일은 읽으면서 지우므로 한 번만 순회할 수 있음#
+        if not self.spilled:
+            yield from self._entries.values()
+            return
+
+        self._spill()
+        partition_rows, self._partition_rows = self._partition_rows, {}
+        runs = []
+        for idx in sorted(partition_rows):
+            runs.extend(self._sorted_runs(self._partition_path(idx), partition_rows[idx]))
+        yield from heapq.merge(*(self._iter_run(run) for run in runs), key=lambda entry: entry[SEQUENCE])
+
+    def format_sources(self, sources, extra=0, limit=None) -> str:
+        #'덱#슬라이드#No; ...' 형식의 출현 목록 (sources: 중복 없는 출현 위치, extra: 보관하지 않은 출현 수)#
+        parts = []
+        length = 0
+        for count, (deck_idx, slide, no) in enumerate(sources):
+            part = f"{os.path.basename(self.decks[deck_idx])}#{slide}#{'' if no is None else no}"
+            if limit and length + len(part) + 2 > limit - 16:
+                extra += len(sources) - count
+                break
+            parts.append(part)
+            length += len(part) + 2
+        if extra:
+            parts.append(f"... (+{extra})")
+        return "; ".join(parts)
+
+    def iter_rows(self, source_limit=None) -> Iterator[list]:
+        for entry in self.iter_merged():
+            sources = self.format_sources(entry[SOURCES], entry[EXTRA], source_limit)
+            yield list(entry[VALUES]) + [entry[COUNT], len(entry[DECKS]), sources]
+
+    def write_xlsx(self, path) -> int:
+        #스트리밍(write_only) 워크북 - 시트당 행 한도를 넘으면 다음 시트로#
+        wb = Workbook(write_only=True)
+        header_font = Font(bold=True)
+
+        def header_row(ws):
+            cells = []
+            for header in self.headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = header_font
+                cells.append(cell)
+            return cells
+
+        sheet_no = 0
+        ws = None
+        sheet_rows = EXCEL_MAX_ROWS
+        count = 0
+
+        for row in self.iter_rows(EXCEL_MAX_CELL):
+            if sheet_rows >= EXCEL_MAX_ROWS:
+                sheet_no += 1
+                ws = wb.create_sheet('통합 태깅' if sheet_no == 1 else f'통합 태깅 {sheet_no}')
+                ws.append(header_row(ws))
+                sheet_rows = 1
+            ws.append(row)
+            sheet_rows += 1
+            count += 1
+
+        if ws is None:
+            ws = wb.create_sheet('통합 태깅')
+            ws.append(header_row(ws))
+
+        decks = wb.create_sheet('Decks')
+        decks.append(['Deck'])
+        for deck in self.decks:
+            decks.append([deck])
+
+        wb.save(path)
+        return count
+
+    def write_parquet(self, path, batch_rows=100000) -> int:
+        pa, pq = require_pyarrow()
+
+        schema = pa.schema(
+            [(key, pa.string()) for key in self.attribute_keys] +
+            [('Count', pa.int64()), ('Decks', pa.int64()), ('Sources', pa.string())]
+        )
+        count = 0
+        with pq.ParquetWriter(path, schema) as writer:
+            batch = []
+            for row in self.iter_rows():
+                batch.append(row)
+                if len(batch) >= batch_rows:
+                    writer.write_table(pa.Table.from_pylist([dict(zip(self.headers, r)) for r in batch], schema))
+                    count += len(batch)
+                    batch = []
+            if batch:
+                writer.write_table(pa.Table.from_pylist([dict(zip(self.headers, r)) for r in batch], schema))
+                count += len(batch)
+        return count
+
+    def write_shards(self, path, by='ga-ca', split='sheets', workers=None) -> int:
+        #ga-ca 카테고리별 시트/파일로 나눠서 저장 (tag_shards) - 통합 행은 카테고리별 임시 파일로 흘려보냄#
+        records = (dict(zip(self.headers, row)) for row in self.iter_rows(EXCEL_MAX_CELL))
+        shards = write_shard_stream(path, records, self.headers, by, split, workers=workers,
+                                    spill_dir=self._spill_root)
+        return sum(len(shard.records) for shard in shards)
+
+    def write(self, path) -> int:
+        if path.lower().endswith('.parquet'):
+            return self.write_parquet(path)
+        return self.write_xlsx(path)
+
+
+def main(argv=None):
+    from deck_extractor import extract_deck, collect_decks
+    from ppt_converter import convert_decks
+    from deck_pipeline import DeckPipeline
+    from isolated_runner import DEFAULT_TIMEOUT, DEFAULT_MEMORY_MB
+
+    parser = argparse.ArgumentParser(description="여러 태깅 가이드의 태깅 데이터 통합/중복 제거")
+    parser.add_argument('paths', nargs='+', help=".pptx 파일 또는 폴더")
+    parser.add_argument('-o', '--output', required=True, help="출력 파일 (.xlsx 또는 .parquet)")
+    parser.add_argument('--spill-dir', help="임시 분할 파일 위치")
+    parser.add_argument('--max-memory-rows', type=int, default=500000, help="메모리에 유지할 최대 레코드 수")
+    parser.add_argument('--max-sources', type=int, default=DEFAULT_MAX_SOURCES,
+                        help="태그당 Sources에 남길 출현 위치 수")
+    parser.add_argument('--shard-by', choices=('ga-ca',), help="카테고리별로 나눠서 저장 (.xlsx만)")
+    parser.add_argument('--split', choices=SPLIT_MODES, default='sheets', help="--shard-by 사용 시 시트/파일 분할")
+    parser.add_argument('--workers', type=int, default=0, help="격리 워커 프로세스 수 (0이면 현재 프로세스에서 처리)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="덱당 처리 시간 한도(초)")
+    parser.add_argument('--memory-mb', type=int, default=DEFAULT_MEMORY_MB, help="워커당 메모리 한도(MB)")
+    args = parser.parse_args(argv)
+    if args.shard_by and not args.output.lower().endswith('.xlsx'):
+        parser.error("--shard-by는 .xlsx 출력에서만 사용할 수 있습니다.")
+
+    if args.output.lower().endswith('.parquet'):
+        # 추출을 다 끝낸 뒤에 실패하지 않도록 미리 확인
+        try:
+            require_pyarrow()
+        except RuntimeError as e:
+            print(f"[Error] {e}")
+            return 1
+
+    decks = collect_decks(args.paths, ('.pptx', '.ppt'))
+    with TagMerger(args.spill_dir, args.max_memory_rows, max_sources=args.max_sources) as merger:
+        if args.workers:
+            # 덱마다 격리 워커에서 추출, 다음 덱 읽기/추출/병합을 겹쳐서 처리
+            # (병합은 write 스레드 하나에서만 실행, 한도 초과 덱은 건너뜀)
+            def merge(result):
+                merger.add_records(result.path, result.records)
+
+            def on_result(result):
+                if not result.ok:
+                    print(f"[{result.status}] {os.path.basename(result.path)}: {result.message}")
+
+            with DeckPipeline(args.workers, writer=merge, timeout=args.timeout, memory_mb=args.memory_mb) as pipeline:
+                pipeline.run(decks, on_result)
+                print(pipeline.format_utilization())
+        else:
+            # .ppt는 시작 전에 한 번에 변환 (워커 모드는 DeckPipeline이 같은 방식으로 변환)
+            load_paths, failed = convert_decks(decks)
+            for deck in decks:
+                if deck in failed:
+                    print(f"[Error] {os.path.basename(deck)}: {failed[deck]}")
+                    continue
+                try:
+                    merger.add_records(deck, extract_deck(load_paths[deck]))
+                except Exception as e:
+                    print(f"[Error] {os.path.basename(deck)}: {e}")
+        try:
+            if args.shard_by:
+                count = merger.write_shards(args.output, args.shard_by, args.split, args.workers or None)
+            else:
+                count = merger.write(args.output)
+        except RuntimeError as e:
+            print(f"[Error] {e}")
+            return 1
+        print(f"덱 {len(merger.decks)}개, 레코드 {merger.total_records}개 -> 고유 태깅 {count}개: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+from typing import List, Dict, Optional
+
+import os
+import re
+import sys
+import json
+
+# 태깅 스키마 (속성 이름, Action 키워드, 제외 태그, 출력 컬럼)
+# - tagging_schema.json(또는 .toml)에서 한 번만 읽어서 정규식으로 컴파일
+# - 속성은 전부 하나의 정규식으로 한 번에 검색 (속성 수가 늘어도 텍스트는 한 번만 훑음)
+# - 새 태그 계열(다른 분석 도구 등)은 스키마 파일에 이름만 추가하면 됨
+# - TAGGING_SCHEMA 환경 변수로 다른 스키마 파일 지정 가능 (격리 워커에도 그대로 전달됨)
+
+SCHEMA_FILE = 'tagging_schema.json'
+SCHEMA_ENV = 'TAGGING_SCHEMA'
+
+
+class SchemaError(Exception):
+    pass
+
+
+def schema_path() -> str:
+    #기본 스키마 파일 위치 (PyInstaller 번들이면 압축 해제 경로)#
+    path = os.environ.get(SCHEMA_ENV)
+    if path:
+        return path
+    base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, SCHEMA_FILE)
+
+
+def _alternation(words) -> str:
+    # 긴 이름 먼저 (data-omni-type이 data-omni보다 앞)
+    return '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+class TagSchema:
+    def __init__(self, attributes: List[str], action_keywords: List[str], exclude_tags: List[str],
+                 quote_replacements: Optional[Dict[str, str]] = None, record_columns: Optional[List[str]] = None):
+        if not attributes:
+            raise SchemaError("스키마에 속성(attributes)이 없습니다.")
+        self.attributes = list(attributes)
+        self.action_keywords = [keyword.lower() for keyword in action_keywords]
+        self.exclude_tags = list(exclude_tags)
+        self.quote_replacements = list((quote_replacements or {}).items())
+        self.record_columns = list(record_columns or ['No', 'Slide', 'Title', 'Action'])
+
+        names = _alternation(self.attributes)
+        self.attribute_pattern = re.compile(rf'({names})\s*=\s*"([^"]+)"')
+        # 헤더 인덱스 표 형식: 공백 없이 key="value" (빈 값 허용)
+        self.strict_attribute_pattern = re.compile(rf'({names})="([^"]*)"')
+        # 전방 탐색 버전 - 위치마다 검사하므로 속성별로 따로 search 한 것과 항상 같은 결과 (대신 느림)
+        self._exact_patterns = {
+            self.attribute_pattern: re.compile(rf'(?=({names})\s*=\s*"([^"]+)")'),
+            self.strict_attribute_pattern: re.compile(rf'(?=({names})="([^"]*)")'),
+        }
+        # 속성 이름이 다른 속성 이름 중간에 들어 있으면 항상 전방 탐색 사용
+        self._nested_names = any(
+            other != name and name in other[1:] for name in self.attributes for other in self.attributes)
+        # 태깅 속성이 있을 수 있는 텍스트인지 빠르게 판단
+        self.hint_pattern = re.compile(names)
+        self.exclude_pattern = re.compile(_alternation(self.exclude_tags)) if self.exclude_tags else None
+        self.keyword_pattern = re.compile(_alternation(self.action_keywords)) if self.action_keywords else None
+
+    @property
+    def output_columns(self) -> List[str]:
+        return self.record_columns + self.attributes
+
+    @classmethod
+    def from_dict(cls, data) -> 'TagSchema':
+        try:
+            return cls(
+                data['attributes'],
+                data.get('action_keywords', []),
+                data.get('exclude_tags', []),
+                data.get('quote_replacements'),
+                data.get('record_columns')
+            )
+        except (KeyError, TypeError, re.error) as e:
+            raise SchemaError(f"잘못된 태깅 스키마: {e}")
+
+    @classmethod
+    def load(cls, path) -> 'TagSchema':
+        #JSON 또는 TOML(Python 3.11+) 스키마 파일 로드#
+        try:
+            if path.lower().endswith('.toml'):
+                try:
+                    import tomllib
+                except ImportError:
+                    raise SchemaError("TOML 스키마에는 Python 3.11 이상이 필요합니다.")
+                with open(path, 'rb') as f:
+                    data = tomllib.load(f)
+            else:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise SchemaError(f"태깅 스키마를 읽을 수 없습니다: {path} ({e})")
+        return cls.from_dict(data)
+
+    def normalize_quotes(self, text) -> str:
+        for old, new in self.quote_replacements:
+            text = text.replace(old, new)
+        return text
+
+    def _collect(self, pattern, text) -> Dict[str, str]:
+        #통합 정규식 1회 검색 - 속성마다 첫 번째 값#
+        if '=' not in text:
+            # 속성 형식(key="value")이 있을 수 없는 텍스트 (대부분의 셀)
+            return {}
+        if self._nested_names:
+            pattern = self._exact_patterns[pattern]
+        attributes = {}
+        remaining = len(self.attributes)
+        for match in pattern.finditer(text):
+            key, value = match.groups()
+            if '=' in value and pattern in self._exact_patterns and self.hint_pattern.search(value):
+                # 값 안에 다른 속성이 겹쳐 있는 드문 경우 - 겹친 검색으로 다시
+                return self._collect(self._exact_patterns[pattern], text)
+            if key not in attributes:
+                attributes[key] = value
+                remaining -= 1
+                if not remaining:
+                    break
+        # 스키마 순서로 정렬
+        return {key: attributes[key] for key in self.attributes if key in attributes}
+
+    def extract_attributes(self, text) -> Dict[str, str]:
+        #텍스트에서 태깅 속성 추출 (따옴표 정리, 앞뒤 공백 제거)#
+        attributes = self._collect(self.attribute_pattern, self.normalize_quotes(text))
+        return {key: value.strip() for key, value in attributes.items()}
+
+    def extract_strict(self, text) -> Dict[str, str]:
+        #key="value" 형식만 원문 그대로 추출#
+        return self._collect(self.strict_attribute_pattern, text)
+
+    def is_action(self, cell) -> bool:
+        #No 그룹 셀이 Action 설명인지 판단#
+        if not cell or (self.exclude_pattern and self.exclude_pattern.search(cell)):
+            return False
+        if self.keyword_pattern and self.keyword_pattern.search(cell.lower()):
+            return True
+        return len(cell) > 5 and '=' not in cell and cell not in ['　', '']
+
+
+_default_schema = None
+
+
+def default_schema() -> TagSchema:
+    #프로세스당 한 번만 로드#
+    global _default_schema
+    if _default_schema is None:
+        _default_schema = TagSchema.load(schema_path())
+    return _default_schema
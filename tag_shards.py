@@ -0,0 +1,379 @@
+from typing import List, Dict, Iterable
+
+import os
+import re
+import sys
+import pickle
+import shutil
+import argparse
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.worksheet.hyperlink import Hyperlink
+
+from tag_schema import default_schema
+
+# 큰 추출 결과를 여러 시트/파일로 나눠서 저장
+# - 기준: 슬라이드 범위(slide) 또는 ga-ca 카테고리(ga-ca)
+# - 방식: 한 워크북의 여러 시트(sheets) 또는 조각별 파일(files, 프로세스 병렬 저장)
+# - 맨 앞 Index 시트에 조각별 범위/레코드 수와 해당 시트/파일 하이퍼링크
+# - 모든 워크북은 스트리밍(write_only)으로 작성, 시트당 행 한도를 넘는 조각은 다시 나눔
+# - write_shard_stream: 레코드 이터레이터를 조각별 임시 파일로 내보낸 뒤 저장 (전체 목록을 메모리에 두지 않음)
+#
+#   python tag_shards.py <pptx 파일 또는 폴더> [...] -o tagging.xlsx --by ga-ca --split files --workers 4
+
+SHARD_BY = ('slide', 'ga-ca')
+SPLIT_MODES = ('sheets', 'files')
+DEFAULT_SLIDES_PER_SHARD = 50
+
+EXCEL_MAX_ROWS = 1048576
+SHEET_TITLE_MAX = 31
+INVALID_TITLE_CHARS = re.compile(r'[\[\]:*?/\\]')
+NO_CATEGORY = "(ga-ca 없음)"
+INDEX_HEADERS = ['Shard', 'Slides', 'Records', 'Link']
+SPILL_CHUNK_ROWS = 10000
+
+
+def _slide_range(low, high) -> str:
+    if low is None:
+        return ""
+    return str(low) if low == high else f"{low}-{high}"
+
+
+class SpilledRecords:
+    #임시 파일에 pickle 청크로 저장된 조각 레코드 (len/순회만 지원, 프로세스 풀에 경로만 전달됨)#
+    __slots__ = ('path', 'count', 'low', 'high')
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.low = None     # 슬라이드 범위
+        self.high = None
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        if not self.count:
+            return
+        with open(self.path, 'rb') as f:
+            while True:
+                try:
+                    chunk = pickle.load(f)
+                except EOFError:
+                    return
+                yield from chunk
+
+    def add(self, slide):
+        self.count += 1
+        if isinstance(slide, int):
+            self.low = slide if self.low is None else min(self.low, slide)
+            self.high = slide if self.high is None else max(self.high, slide)
+
+    def append_chunk(self, records):
+        with open(self.path, 'ab') as f:
+            pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class Shard:
+    __slots__ = ('label', 'records', 'title', 'path')
+
+    def __init__(self, label, records=None):
+        self.label = label
+        self.records = records if records is not None else []
+        self.title = None   # 시트 이름
+        self.path = None    # files 방식의 파일 경로
+
+    @property
+    def slide_range(self) -> str:
+        if isinstance(self.records, SpilledRecords):
+            return _slide_range(self.records.low, self.records.high)
+        slides = [record.get('Slide') for record in self.records if isinstance(record.get('Slide'), int)]
+        if not slides:
+            return ""
+        return _slide_range(min(slides), max(slides))
+
+
+def _deck_label(record) -> str:
+    deck = record.get('Deck')
+    return f"{os.path.splitext(os.path.basename(deck))[0]} " if deck else ""
+
+
+def _check_shard_by(by, slides_per_shard):
+    if by not in SHARD_BY:
+        raise ValueError(f"지원하지 않는 분할 기준: {by}")
+    if by == 'slide' and slides_per_shard < 1:
+        raise ValueError(f"조각당 슬라이드 수는 1 이상이어야 합니다: {slides_per_shard}")
+
+
+def _shard_key(record, by, slides_per_shard) -> tuple:
+    #레코드가 속하는 조각의 (키, 이름)#
+    if by == 'slide':
+        slide = record.get('Slide')
+        group = (slide - 1) // slides_per_shard if isinstance(slide, int) and slide > 0 else -1
+        if group < 0:
+            return (record.get('Deck'), group), f"{_deck_label(record)}슬라이드 없음"
+        low = group * slides_per_shard + 1
+        return (record.get('Deck'), group), f"{_deck_label(record)}슬라이드 {low}-{low + slides_per_shard - 1}"
+    key = (record.get('ga-ca') or '').strip() or NO_CATEGORY
+    return key, key
+
+
+def shard_records(records: List[Dict], by='slide', slides_per_shard=DEFAULT_SLIDES_PER_SHARD,
+                  max_rows=EXCEL_MAX_ROWS - 1) -> List[Shard]:
+    #레코드 -> 조각 목록 (처음 나온 순서, 조각마다 레코드 순서 유지)#
+    _check_shard_by(by, slides_per_shard)
+
+    shards: Dict[object, Shard] = {}
+    for record in records:
+        key, label = _shard_key(record, by, slides_per_shard)
+        if key not in shards:
+            shards[key] = Shard(label)
+        shards[key].records.append(record)
+
+    # 시트 행 한도를 넘는 조각은 나눔
+    result = []
+    for shard in shards.values():
+        if len(shard.records) <= max_rows:
+            result.append(shard)
+            continue
+        for part, start in enumerate(range(0, len(shard.records), max_rows), start=1):
+            result.append(Shard(f"{shard.label} ({part})", shard.records[start:start + max_rows]))
+    return result
+
+
+def spill_shards(records: Iterable[Dict], spill_dir, by='slide', slides_per_shard=DEFAULT_SLIDES_PER_SHARD,
+                 max_rows=EXCEL_MAX_ROWS - 1) -> List[Shard]:
+    #레코드 이터레이터 -> spill_dir의 조각별 파일 (shard_records와 같은 순서/이름, 메모리에는 청크 하나만)#
+    _check_shard_by(by, slides_per_shard)
+
+    parts: Dict[object, List[Shard]] = {}
+    pending: Dict[SpilledRecords, list] = {}
+    buffered = 0
+    count = 0
+
+    def flush():
+        for spilled, chunk in pending.items():
+            spilled.append_chunk(chunk)
+        pending.clear()
+
+    for record in records:
+        key, label = _shard_key(record, by, slides_per_shard)
+        shards = parts.get(key)
+        if shards is None or len(shards[-1].records) >= max_rows:
+            count += 1
+            shard = Shard(label, SpilledRecords(os.path.join(spill_dir, f"{count:05d}.pkl")))
+            parts.setdefault(key, []).append(shard)
+        else:
+            shard = shards[-1]
+        shard.records.add(record.get('Slide'))
+        pending.setdefault(shard.records, []).append(record)
+        buffered += 1
+        if buffered >= SPILL_CHUNK_ROWS:
+            flush()
+            buffered = 0
+    flush()
+
+    result = []
+    for shards in parts.values():
+        if len(shards) > 1:
+            for part, shard in enumerate(shards, start=1):
+                shard.label = f"{shard.label} ({part})"
+        result.extend(shards)
+    return result
+
+
+def sheet_title(label, used) -> str:
+    #엑셀 시트 이름 규칙 (31자, 금지 문자) + 중복 방지#
+    base = INVALID_TITLE_CHARS.sub('_', label).strip("' ") or "Shard"
+    title = base[:SHEET_TITLE_MAX]
+    count = 1
+    while title.lower() in used or title.lower() == 'index':
+        count += 1
+        suffix = f" ({count})"
+        title = base[:SHEET_TITLE_MAX - len(suffix)] + suffix
+    used.add(title.lower())
+    return title
+
+
+def file_stem(label) -> str:
+    return re.sub(r'[^\w\-]+', '_', label).strip('_') or "shard"
+
+
+def output_columns(records) -> List[str]:
+    columns = default_schema().output_columns
+    if any('Deck' in record for record in records[:1000]):
+        columns = ['Deck'] + columns
+    return columns
+
+
+def _header_cells(ws, headers, font):
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = font
+        cells.append(cell)
+    return cells
+
+
+def _write_records(ws, records, columns):
+    #헤더 1행 + 레코드 (첫 행 고정)#
+    ws.freeze_panes = 'A2'
+    ws.append(_header_cells(ws, columns, Font(bold=True)))
+    for record in records:
+        ws.append([record.get(column, '') for column in columns])
+
+
+def _link_cell(ws, text, target=None, location=None):
+    cell = WriteOnlyCell(ws, value=text)
+    cell.hyperlink = target if target else Hyperlink(ref='', location=location)
+    cell.style = 'Hyperlink'
+    return cell
+
+
+def _write_index(wb, shards: List[Shard], base_dir=None):
+    ws = wb.create_sheet('Index')
+    ws.append(_header_cells(ws, INDEX_HEADERS, Font(bold=True)))
+    for shard in shards:
+        if shard.path:
+            target = os.path.relpath(shard.path, base_dir).replace(os.sep, '/')
+            link = _link_cell(ws, os.path.basename(shard.path), target=target)
+        else:
+            link = _link_cell(ws, shard.title, location=f"'{shard.title}'!A1")
+        ws.append([shard.label, shard.slide_range, len(shard.records), link])
+    return ws
+
+
+def write_shard_file(path, title, records, columns) -> int:
+    #조각 하나를 단독 워크북으로 저장 (프로세스 풀에서 실행)#
+    wb = Workbook(write_only=True)
+    _write_records(wb.create_sheet(title), records, columns)
+    wb.save(path)
+    return len(records)
+
+
+def write_sheets(path, shards: List[Shard], columns):
+    #한 워크북에 Index + 조각별 시트#
+    used = set()
+    for shard in shards:
+        shard.title = sheet_title(shard.label, used)
+
+    wb = Workbook(write_only=True)
+    _write_index(wb, shards)
+    for shard in shards:
+        _write_records(wb.create_sheet(shard.title), shard.records, columns)
+    wb.save(path)
+
+
+def write_files(path, shards: List[Shard], columns, workers=None):
+    #조각별 파일(<출력 이름>_shards 폴더)을 병렬로 저장하고, path에는 Index 워크북만#
+    base_dir = os.path.dirname(os.path.abspath(path))
+    shard_dir = os.path.join(base_dir, f"{os.path.splitext(os.path.basename(path))[0]}_shards")
+    os.makedirs(shard_dir, exist_ok=True)
+
+    used = set()
+    for idx, shard in enumerate(shards, start=1):
+        shard.title = sheet_title(shard.label, used)
+        shard.path = os.path.join(shard_dir, f"{idx:03d}_{file_stem(shard.label)}.xlsx")
+
+    workers = min(workers or os.cpu_count() or 1, len(shards))
+    if workers > 1:
+        # openpyxl 저장은 CPU 작업이므로 스레드 대신 프로세스 (spawn: GUI/Qt 부모를 fork하지 않음)
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(workers, mp_context=context) as executor:
+            futures = [executor.submit(write_shard_file, shard.path, shard.title, shard.records, columns)
+                       for shard in shards]
+            for future in futures:
+                future.result()
+    else:
+        for shard in shards:
+            write_shard_file(shard.path, shard.title, shard.records, columns)
+
+    wb = Workbook(write_only=True)
+    _write_index(wb, shards, base_dir)
+    wb.save(path)
+
+
+def write_shards(path, records: List[Dict], by='slide', split='sheets',
+                 slides_per_shard=DEFAULT_SLIDES_PER_SHARD, workers=None, columns=None) -> List[Shard]:
+    #레코드를 나눠서 저장하고 조각 목록 반환 (columns: 출력 열, 기본은 태깅 스키마 열)#
+    if split not in SPLIT_MODES:
+        raise ValueError(f"지원하지 않는 저장 방식: {split}")
+    shards = shard_records(records, by, slides_per_shard)
+    columns = columns or output_columns(records)
+    if split == 'files':
+        write_files(path, shards, columns, workers)
+    else:
+        write_sheets(path, shards, columns)
+    return shards
+
+
+def write_shard_stream(path, records: Iterable[Dict], columns, by='slide', split='sheets',
+                       slides_per_shard=DEFAULT_SLIDES_PER_SHARD, workers=None, spill_dir=None) -> List[Shard]:
+    #write_shards의 스트리밍 버전 - 레코드를 조각별 임시 파일로 나눈 뒤 저장 (columns 필수)#
+    if split not in SPLIT_MODES:
+        raise ValueError(f"지원하지 않는 저장 방식: {split}")
+    _check_shard_by(by, slides_per_shard)
+    temp_dir = tempfile.mkdtemp(prefix="tag_shards_", dir=spill_dir)
+    try:
+        shards = spill_shards(records, temp_dir, by, slides_per_shard)
+        if split == 'files':
+            write_files(path, shards, columns, workers)
+        else:
+            write_sheets(path, shards, columns)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return shards
+
+
+def positive_int(value) -> int:
+    #argparse용 1 이상 정수#
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+
+def main(argv=None):
+    from deck_extractor import extract_deck, collect_decks
+    from ppt_converter import convert_decks
+
+    parser = argparse.ArgumentParser(description="태깅 데이터를 슬라이드 범위/ga-ca 기준으로 나눠서 저장")
+    parser.add_argument('paths', nargs='+', help=".pptx/.ppt 파일 또는 폴더")
+    parser.add_argument('-o', '--output', required=True, help="출력 워크북 (files 방식이면 Index 워크북)")
+    parser.add_argument('--by', choices=SHARD_BY, default='slide', help="분할 기준")
+    parser.add_argument('--split', choices=SPLIT_MODES, default='sheets', help="시트로 나눌지 파일로 나눌지")
+    parser.add_argument('--slides-per-shard', type=positive_int, default=DEFAULT_SLIDES_PER_SHARD,
+                        help="slide 기준일 때 조각당 슬라이드 수")
+    parser.add_argument('--workers', type=int, default=0, help="files 방식 병렬 저장 프로세스 수 (0이면 CPU 수)")
+    args = parser.parse_args(argv)
+
+    decks = collect_decks(args.paths, ('.pptx', '.ppt'))
+    # .ppt는 시작 전에 한 번에 변환 (soffice 기동 최소화)
+    load_paths, failed = convert_decks(decks)
+    records = []
+    for deck in decks:
+        if deck in failed:
+            print(f"[Error] {os.path.basename(deck)}: {failed[deck]}")
+            continue
+        try:
+            deck_records = extract_deck(load_paths[deck])
+        except Exception as e:
+            print(f"[Error] {os.path.basename(deck)}: {e}")
+            continue
+        if len(decks) > 1:
+            for record in deck_records:
+                record['Deck'] = os.path.basename(deck)
+        records.extend(deck_records)
+
+    shards = write_shards(args.output, records, args.by, args.split, args.slides_per_shard, args.workers or None)
+    print(f"덱 {len(decks)}개, 레코드 {len(records)}개 -> 조각 {len(shards)}개: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
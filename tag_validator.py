@@ -0,0 +1,135 @@
+from typing import List, Dict
+
+import json
+import pandas as pd
+
+from tag_schema import default_schema
+
+# 추출된 태깅 레코드 검증 (pandas 컬럼 단위 연산으로 일괄 처리)
+# 속성 키는 태깅 스키마(extract_tagging_attributes와 같은 목록)에서 가져옴
+
+# 아래 규칙이 직접 참조하는 속성 (스키마에 없어도 빈 컬럼으로 채움)
+RULE_KEYS = ['data-omni-type', 'data-omni', 'ga-ca', 'ga-ac', 'ga-la']
+
+# 명명 규칙 (속성 키 -> 전체 일치 정규식, 설명)
+NAMING_RULES = {
+    'data-omni': (r'[a-z0-9][a-z0-9\-_.^]*(?::[a-z0-9\-_.^]+)*(?:\|;[A-Za-z0-9\-_.,;]+)?',
+                  "소문자/숫자/-_.^ 로 된 ':' 구분 세그먼트 (선택: '|;' 제품 코드)"),
+    'ga-ca': (r'[a-z0-9][a-z0-9 \-_]*[a-z0-9]|[a-z0-9]',
+              "소문자/숫자/공백/-_ (앞뒤 공백 불가)"),
+    'ga-ac': (r'[a-z0-9][a-z0-9 \-_]*[a-z0-9]|[a-z0-9]',
+              "소문자/숫자/공백/-_ (앞뒤 공백 불가)"),
+    'ga-la': (r'[a-z0-9][a-z0-9\-_.^]*(?::[a-z0-9\-_.^]+)*',
+              "소문자/숫자/-_.^ 로 된 ':' 구분 세그먼트"),
+}
+
+ISSUE_COLUMNS = ['Row', 'Slide', 'No', 'Level', 'Rule', 'Attribute', 'Value', 'Message']
+
+VALIDATION_HEADERS = ['Slide', 'No', 'Level', 'Rule', 'Attribute', 'Value', 'Message']
+
+
+def attribute_keys() -> List[str]:
+    #스키마 속성 + 규칙에 필요한 속성 (스키마 순서 우선)#
+    keys = list(default_schema().attributes)
+    return keys + [key for key in RULE_KEYS if key not in keys]
+
+
+def _frame(records: List[Dict], keys: List[str]) -> pd.DataFrame:
+    #레코드 -> 속성 컬럼이 모두 있는 문자열 DataFrame#
+    df = pd.DataFrame.from_records(records)
+    for key in ['Slide', 'No'] + keys:
+        if key not in df.columns:
+            df[key] = None
+    for key in keys:
+        df[key] = df[key].astype('string')
+    df['Row'] = range(1, len(df) + 1)
+    return df
+
+
+def _issues(df, mask, level, rule, attribute, message) -> pd.DataFrame:
+    #mask에 해당하는 행을 이슈 프레임으로 변환#
+    hit = df.loc[mask, ['Row', 'Slide', 'No']].copy()
+    hit['Level'] = level
+    hit['Rule'] = rule
+    hit['Attribute'] = attribute
+    hit['Value'] = df.loc[mask, attribute] if attribute in df.columns else ''
+    hit['Message'] = message
+    return hit
+
+
+def validate_records(records: List[Dict]) -> pd.DataFrame:
+    #모든 규칙을 컬럼 단위로 적용하여 이슈 DataFrame 반환#
+    if not records:
+        return pd.DataFrame(columns=ISSUE_COLUMNS)
+
+    keys = attribute_keys()
+    df = _frame(records, keys)
+    present = {key: df[key].notna() & (df[key].str.len() > 0) for key in keys}
+    found = []
+
+    # 1. 명명 규칙
+    for key, (pattern, description) in NAMING_RULES.items():
+        mask = present[key] & ~df[key].str.fullmatch(pattern).fillna(False).astype(bool)
+        found.append(_issues(df, mask, 'error', 'naming', key, f"명명 규칙 위반: {description}"))
+
+    # 2. data-omni 없이 data-omni-type만 있는 경우
+    mask = present['data-omni-type'] & ~present['data-omni']
+    found.append(_issues(df, mask, 'error', 'type-without-omni', 'data-omni-type',
+                         "data-omni 없이 data-omni-type만 지정됨"))
+
+    # 3. 페이지(슬라이드) 내 data-omni 중복 - 서로 다른 No에서 같은 값 사용
+    for key in ('data-omni', 'ga-la'):
+        keyed = df[present[key]]
+        no_count = keyed.groupby(['Slide', key], sort=False)['No'].transform('nunique')
+        mask = pd.Series(False, index=df.index)
+        mask.loc[keyed.index] = no_count > 1
+        found.append(_issues(df, mask, 'error', 'duplicate', key,
+                             f"같은 슬라이드의 다른 No에서 {key} 값이 중복됨"))
+
+    # 4. data-omni는 있지만 GA 속성이 빠진 경우
+    for key in ('ga-ca', 'ga-ac', 'ga-la'):
+        mask = present['data-omni'] & ~present[key]
+        found.append(_issues(df, mask, 'warning', 'missing-ga', key, f"data-omni에 대응하는 {key} 누락"))
+
+    # 5. ga-la는 data-omni에서 제품 코드('|;...')를 뺀 값과 같아야 함
+    both = present['data-omni'] & present['ga-la']
+    omni_base = df['data-omni'].str.split('|', n=1, regex=False).str[0]
+    mask = both & (omni_base != df['ga-la']).fillna(False).astype(bool)
+    found.append(_issues(df, mask, 'warning', 'ga-la-mismatch', 'ga-la', "ga-la와 data-omni 값 불일치"))
+
+    issues = pd.concat(found, ignore_index=True)
+    issues['Value'] = issues['Value'].astype('object').where(issues['Value'].notna(), '')
+    return issues.sort_values(['Row', 'Level'], kind='stable').reset_index(drop=True)[ISSUE_COLUMNS]
+
+
+def build_report(issues: pd.DataFrame, total_records) -> Dict:
+    #기계 판독용 리포트 (JSON 직렬화 가능)#
+    return {
+        'total_records': int(total_records),
+        'error_count': int((issues['Level'] == 'error').sum()),
+        'warning_count': int((issues['Level'] == 'warning').sum()),
+        'by_rule': {rule: int(count) for rule, count in issues['Rule'].value_counts().items()},
+        'issues': json.loads(issues.to_json(orient='records', force_ascii=False)),
+    }
+
+
+def write_report(path, report):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def write_validation_sheet(wb, issues: pd.DataFrame, header_font=None, header_fill=None, header_alignment=None):
+    #워크북에 Validation 시트 추가#
+    ws = wb.create_sheet('Validation')
+    ws.append(VALIDATION_HEADERS)
+    for cell in ws[1]:
+        if header_font:
+            cell.font = header_font
+        if header_fill:
+            cell.fill = header_fill
+        if header_alignment:
+            cell.alignment = header_alignment
+
+    for row in issues[VALIDATION_HEADERS].itertuples(index=False, name=None):
+        ws.append(['' if pd.isna(value) else value for value in row])
+    return ws
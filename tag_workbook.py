@@ -0,0 +1,68 @@
+from typing import List, Dict
+
+import os
+
+from openpyxl import Workbook
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+from tag_schema import default_schema
+from tag_validator import validate_records, build_report, write_report, write_validation_sheet
+
+# 덱 하나의 태깅 레코드 -> 엑셀 워크북 (+ 검증 리포트 JSON)
+# GUI(PPTDataExtractor.save_to_excel)와 배치 파이프라인의 writer 단계에서 공용으로 사용
+
+START_ROW = 5
+START_COL = 4  # D열
+
+
+def report_path_for(xlsx_path) -> str:
+    return f"{os.path.splitext(xlsx_path)[0]}_validation.json"
+
+
+def write_tagging_workbook(path, records: List[Dict]) -> Dict:
+    #'태깅 데이터' 시트(5행, D열부터) + Validation 시트 저장 후 검증 리포트 반환#
+    wb = Workbook()
+    ws = wb.active
+    ws.title = '태깅 데이터'
+
+    # 헤더 설정
+    headers = default_schema().output_columns
+
+    # 헤더 스타일
+    header_font = Font(bold=True)
+    header_fill = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
+    header_alignment = Alignment(horizontal="center", vertical="center")
+
+    for col_idx, header in enumerate(headers):
+        cell = ws.cell(row=START_ROW, column=START_COL + col_idx, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+
+    # 데이터 작성
+    thin_border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+
+    for row_idx, data in enumerate(records, start=START_ROW + 1):
+        for col_idx, header in enumerate(headers):
+            cell = ws.cell(
+                row=row_idx,
+                column=START_COL + col_idx,
+                value=data.get(header, '')
+            )
+            cell.border = thin_border
+
+    # 태깅 규칙 검증 결과 시트
+    issues = validate_records(records)
+    write_validation_sheet(wb, issues, header_font, header_fill, header_alignment)
+
+    wb.save(path)
+
+    # 검증 리포트 (JSON)
+    report = build_report(issues, len(records))
+    write_report(report_path_for(path), report)
+    return report
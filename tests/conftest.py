@@ -0,0 +1,76 @@
+import json
+import os
+import shutil
+import stat
+import sys
+
+import pytest
+
+# 테스트 공용 설정
+# - 저장소 루트의 모듈을 바로 import할 수 있도록 sys.path에 추가
+# - 샘플 태깅 가이드 덱/골든 레코드, 가짜 soffice 픽스처
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SAMPLE_DECK = os.path.join(ROOT, "P3_Tagging Guide_3rd_241227_TEST - 복사본.pptx")
+GOLDEN_RECORDS = os.path.join(ROOT, "tests", "golden", "sample_records.json")
+
+# 사용한 프로필 URL을 기록하고 입력마다 <이름>.pptx를 만드는 가짜 soffice (내용이 b"bad"로 시작하면 변환 실패)
+FAKE_SOFFICE = """#!{python}
+import os, sys
+args = sys.argv[1:]
+with open({log!r}, 'a') as f:
+    f.write(args[0] + '\\n')
+out_dir = args[args.index('--outdir') + 1]
+os.makedirs(out_dir, exist_ok=True)
+for src in args[args.index('--outdir') + 2:]:
+    if open(src, 'rb').read().startswith(b'bad'):
+        continue
+    name = os.path.splitext(os.path.basename(src))[0]
+    with open(os.path.join(out_dir, name + '.pptx'), 'wb') as f:
+        f.write(open(src, 'rb').read())
+"""
+
+
+@pytest.fixture
+def repo_root():
+    return ROOT
+
+
+@pytest.fixture
+def sample_deck():
+    #샘플 태깅 가이드 덱 경로 (태깅 레코드 13개)#
+    return SAMPLE_DECK
+
+
+@pytest.fixture
+def golden():
+    #샘플 덱의 골든 추출 결과#
+    with open(GOLDEN_RECORDS, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def sample_copies(tmp_path):
+    #tmp_path에 샘플 덱 사본 count개를 만드는 함수 -> 경로 목록#
+    def make(count, prefix="deck", suffix=".pptx"):
+        paths = []
+        for idx in range(count):
+            path = tmp_path / f"{prefix}_{idx}{suffix}"
+            shutil.copy(SAMPLE_DECK, path)
+            paths.append(str(path))
+        return paths
+    return make
+
+
+@pytest.fixture
+def fake_soffice(tmp_path):
+    #(가짜 soffice 경로, 호출마다 프로필 URL이 한 줄씩 쌓이는 로그 경로)#
+    if sys.platform == 'win32':
+        pytest.skip("가짜 soffice 스크립트는 POSIX 전용")
+    log = tmp_path / "soffice.log"
+    soffice = tmp_path / "soffice"
+    soffice.write_text(FAKE_SOFFICE.format(python=sys.executable, log=str(log)))
+    soffice.chmod(soffice.stat().st_mode | stat.S_IEXEC)
+    return soffice, log
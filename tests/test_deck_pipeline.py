@@ -0,0 +1,80 @@
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("pptx")
+
+from deck_pipeline import DeckPipeline, workbook_writer
+
+
+def test_pipeline_extracts_and_writes_every_deck(tmp_path, sample_deck, sample_copies, golden):
+    decks = sample_copies(3) + [str(tmp_path / "missing.pptx")]
+
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    with DeckPipeline(workers=2, queue_size=1, writer=workbook_writer(str(output_dir))) as pipeline:
+        results = pipeline.run(decks)
+        utilization = {row['stage']: row for row in pipeline.utilization()}
+
+    assert [result.path for result in results] == decks
+    for result in results[:3]:
+        assert result.ok
+        assert result.records == golden
+        assert os.path.exists(result.output)
+        assert os.path.exists(result.output.replace('.xlsx', '_validation.json'))
+    assert results[3].status == 'error'
+    assert results[3].output is None
+
+    assert [utilization[stage]['items'] for stage in ('read', 'parse', 'write')] == [4, 4, 4]
+    assert utilization['read']['bytes'] == 3 * os.path.getsize(sample_deck)
+
+
+def test_failing_callbacks_do_not_hang_the_run(sample_copies):
+    decks = sample_copies(4)
+
+    def failing_writer(result):
+        raise OSError("disk full")
+
+    seen = []
+
+    def failing_callback(result):
+        seen.append(result)
+        raise ValueError("callback bug")
+
+    errors = []
+
+    def run():
+        try:
+            pipeline.run(decks, failing_callback)
+        except ValueError as e:
+            errors.append(e)
+
+    with DeckPipeline(workers=2, queue_size=1, writer=failing_writer) as pipeline:
+        runner = threading.Thread(target=run, daemon=True)
+        runner.start()
+        runner.join(60)
+        assert not runner.is_alive()
+    assert [str(e) for e in errors] == ["callback bug"]
+
+    # 콜백 오류가 나도 모든 덱이 끝까지 처리됨 (writer 오류는 결과에 기록)
+    assert sorted(result.path for result in seen) == decks
+    assert all(result.status == 'error' and "disk full" in result.message for result in seen)
+
+
+def test_legacy_decks_are_converted_in_one_batch(tmp_path, sample_copies, fake_soffice):
+    from ppt_converter import PPTConverter
+
+    soffice, log = fake_soffice
+    converter = PPTConverter(str(tmp_path / "cache"), str(soffice), workers=1)
+
+    decks = sample_copies(3, prefix="legacy", suffix=".ppt")
+    (tmp_path / "legacy_1.ppt").write_bytes(b"bad")
+
+    with DeckPipeline(workers=2, writer=lambda result: None, converter=converter) as pipeline:
+        results = pipeline.run(decks)
+
+    assert len(log.read_text().split()) == 1
+    assert [result.path for result in results] == decks
+    assert [result.status for result in results] == ['ok', 'error', 'ok']
+    assert len(results[0].records) == 13
@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("pptx")
+
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Inches
+
+from deck_extractor import extract_presentation
+
+NS_P = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+
+
+def make_deck():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+
+    # 슬라이드 번호 자리표시자 (숫자만 있지만 번호 배지가 아님)
+    number = slide.shapes.add_textbox(Inches(9), Inches(7), Inches(1), Inches(0.5))
+    number.text_frame.text = "7"
+    nv_pr = number._element.find(f'{{{NS_P}}}nvSpPr/{{{NS_P}}}nvPr')
+    etree.SubElement(nv_pr, f'{{{NS_P}}}ph', type='sldNum', idx='12')
+
+    box = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1))
+    box.text_frame.text = 'Banner click data-omni="banner"'
+
+    # 태깅 헤더가 아닌 최상위 테이블
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(3), Inches(6), Inches(1)).table
+    for col, text in enumerate(["No", "Spec"]):
+        table.cell(0, col).text = text
+    table.cell(1, 0).text = "3"
+    table.cell(1, 1).text = 'Spec click data-omni="spec"'
+    return prs
+
+
+def test_deep_scan_covers_non_tagging_top_tables():
+    records = extract_presentation(make_deck())
+    found = {record['data-omni']: record for record in records}
+
+    assert set(found) == {'banner', 'spec'}
+    assert found['banner']['No'] is None
+    assert found['spec']['No'] == 3
+    assert found['spec']['Source'] == 'table'
+
+
+def test_tagging_tables_are_not_extracted_twice(sample_deck):
+    records = extract_presentation(Presentation(sample_deck))
+    assert not any(record.get('Source') == 'table' for record in records)
+
+
+def test_bench_deep_scan_counts_the_same_hits_as_the_app(tmp_path):
+    from extraction_bench import run_deep_benchmark
+
+    deck = str(tmp_path / "deep.pptx")
+    make_deck().save(deck)
+    result = run_deep_benchmark([deck], repeat=1)[deck]
+    assert (result['table_records'], result['deep_hits']) == (0, 2)
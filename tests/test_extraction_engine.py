@@ -0,0 +1,91 @@
+from pptx import Presentation
+from pptx.util import Inches
+
+from deck_extractor import extract_presentation
+from extraction_bench import summarize, recommended_overrides
+from extraction_engine import ExtractionEngine, HeaderIndexStrategy, table_signature
+
+# 구 main.py 형식: 한 행 = 한 레코드
+ROW_TABLE = [
+    ['No.', 'Action', 'Tagging Source'],
+    ['1', 'Banner click', 'data-omni-type="x" data-omni="banner" ga-ca="c" ga-ac="a" ga-la="l"'],
+    ['2', 'CTA\nsecond line', 'data-omni="cta"'],
+    ['3'],
+]
+
+# ppttoexcel2 형식: No 행 아래에 AA/GA 행이 이어짐 (샘플 덱과 같은 모양)
+GROUP_TABLE = [
+    ['No.', '　', 'Tagging Source'],
+    ['1', '　', 'Click to go features'],
+    ['　', 'AA', 'data-omni-type="microsite" data-omni="features"'],
+    ['　', 'GA', 'ga-ca="content click" ga-ac="feature" ga-la="go"'],
+]
+
+
+def test_header_alone_uses_priority_order():
+    assert ExtractionEngine().select_strategy(ROW_TABLE[0]).name == 'group'
+    assert ExtractionEngine(order=['header', 'group']).select_strategy(ROW_TABLE[0]).name == 'header'
+    assert ExtractionEngine().select_strategy(['Spec', 'Value']) is None
+
+
+def test_rows_tell_table_layouts_apart():
+    engine = ExtractionEngine()
+    assert engine.select_strategy(ROW_TABLE[0], ROW_TABLE).name == 'header'
+    assert engine.select_strategy(GROUP_TABLE[0], GROUP_TABLE).name == 'group'
+
+
+def test_overrides_win_over_row_shape():
+    overrides = {table_signature(ROW_TABLE[0]): 'group'}
+    engine = ExtractionEngine(overrides=overrides)
+    assert engine.candidates(ROW_TABLE[0]) == [engine.select_strategy(ROW_TABLE[0], ROW_TABLE)]
+    assert engine.select_strategy(ROW_TABLE[0], ROW_TABLE).name == 'group'
+    # 시그니처가 다른 표는 평소대로 선택
+    assert engine.select_strategy(GROUP_TABLE[0], GROUP_TABLE).name == 'group'
+
+
+def test_header_index_parse():
+    logs = []
+    records = list(HeaderIndexStrategy().parse(ROW_TABLE, 3, "Title",
+                                               lambda message, msg_type="info": logs.append(msg_type)))
+    assert records == [
+        {'Slide': 3, 'Title': "Title", 'No': '1', 'Action': 'Banner click', 'data-omni-type': 'x',
+         'data-omni': 'banner', 'ga-ca': 'c', 'ga-ac': 'a', 'ga-la': 'l'},
+        {'Slide': 3, 'Title': "Title", 'No': '2', 'Action': 'CTA', 'data-omni': 'cta'},
+    ]
+    assert logs == ['warning']  # 셀이 부족한 3행
+
+
+def test_row_layout_deck_goes_through_header_strategy():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    table = slide.shapes.add_table(3, 3, Inches(1), Inches(1), Inches(8), Inches(2)).table
+    for row_idx, row in enumerate(ROW_TABLE[:3]):
+        for col_idx, text in enumerate(row):
+            table.cell(row_idx, col_idx).text = text
+
+    records = extract_presentation(prs, deep=False)
+    assert [(record['No'], record['Action'], record.get('data-omni')) for record in records] == [
+        ('1', 'Banner click', 'banner'), ('2', 'CTA', 'cta')]
+
+
+def test_summarize_recommends_fastest_agreeing_strategy():
+    same, differs = ('no.', 'tagging source'), ('no.', 'action', 'tagging source')
+    key_a, key_b = ('deck', 1, '1', ('a',)), ('deck', 1, '2', ('b',))
+    stats = {
+        same: {'tables': 2, 'rows': 10, 'strategies': {
+            'group': {'seconds': 0.02, 'records': 2, 'keys': {key_a, key_b}},
+            'header': {'seconds': 0.01, 'records': 2, 'keys': {key_a, key_b}},
+        }},
+        differs: {'tables': 1, 'rows': 4, 'strategies': {
+            'group': {'seconds': 0.02, 'records': 2, 'keys': {key_a, key_b}},
+            'header': {'seconds': 0.01, 'records': 3, 'keys': {key_a}},
+        }},
+    }
+
+    summary = summarize(stats)
+    assert summary["no. | tagging source"]['recommended'] == 'header'
+    assert summary["no. | tagging source"]['strategies']['group']['rows_per_sec'] == 500.0
+    header = summary["no. | action | tagging source"]['strategies']['header']
+    assert (header['missing_vs_reference'], header['extra_vs_reference']) == (1, 0)
+    assert summary["no. | action | tagging source"]['recommended'] == 'group'
+    assert recommended_overrides(summary) == {same: 'header', differs: 'group'}
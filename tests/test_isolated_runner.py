@@ -0,0 +1,64 @@
+import sys
+import random
+import string
+import zipfile
+
+import pytest
+
+pytest.importorskip("pptx")
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from isolated_runner import IsolatedPool, ResourceLimitError, check_package, STATUS_OK, STATUS_TIMEOUT, STATUS_MEMORY, STATUS_REJECTED
+
+
+def test_timeout_kills_worker_and_next_deck_still_runs(sample_deck):
+    with IsolatedPool(workers=1, timeout=0.1) as pool:
+        result = pool.run_one(sample_deck)
+        assert result.status == STATUS_TIMEOUT
+        assert not pool.workers[0].alive()
+
+        pool.timeout = 60
+        result = pool.run_one(sample_deck)
+        assert result.status == STATUS_OK
+        assert len(result.records) == 13
+
+
+def large_text_deck(path, words=2000000):
+    #텍스트 상자 하나에 약 18MB 텍스트 (압축률이 낮도록 임의 단어)#
+    rng = random.Random(0)
+    vocabulary = [''.join(rng.choices(string.ascii_letters, k=8)) for _ in range(5000)]
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    box = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+    box.text_frame.text = ' '.join(rng.choices(vocabulary, k=words))
+    prs.save(path)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="RLIMIT_AS 한도 (POSIX)")
+def test_memory_limit_kills_worker_and_next_deck_still_runs(tmp_path, sample_deck):
+    big = tmp_path / "big.pptx"
+    large_text_deck(str(big))
+
+    with IsolatedPool(workers=1, timeout=60, memory_mb=100) as pool:
+        result = pool.run_one(str(big))
+        assert result.status == STATUS_MEMORY
+        assert not pool.workers[0].alive()
+
+        assert pool.run_one(sample_deck).status == STATUS_OK
+
+
+def test_high_ratio_part_is_rejected(tmp_path):
+    bomb = tmp_path / "bomb.pptx"
+    with zipfile.ZipFile(bomb, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("ppt/slides/slide1.xml", b"\0" * (4 * 1024 * 1024))
+
+    with IsolatedPool(workers=1, timeout=60) as pool:
+        result = pool.run_one(str(bomb))
+    assert result.status == STATUS_REJECTED
+    assert "slide1.xml" in result.message
+
+    # 미리 읽은 내용만으로 검사 (디스크의 경로는 열지 않음)
+    with pytest.raises(ResourceLimitError):
+        check_package(str(tmp_path / "missing.pptx"), data=bomb.read_bytes())
@@ -0,0 +1,98 @@
+import os
+import sys
+import stat
+import time
+import threading
+
+import pytest
+
+from ppt_converter import PPTConverter, ConversionError
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="가짜 soffice 스크립트는 POSIX 전용")
+
+
+def test_concurrent_conversions_use_separate_profiles(tmp_path, fake_soffice):
+    soffice, log = fake_soffice
+
+    cache_dir = tmp_path / "cache dir"
+    paths = []
+    for idx in range(4):
+        path = tmp_path / f"deck_{idx}.ppt"
+        path.write_bytes(b"ppt %d" % idx)
+        paths.append(str(path))
+
+    results = []
+    converters = [PPTConverter(str(cache_dir), str(soffice), workers=2) for _ in range(2)]
+    threads = [threading.Thread(target=lambda c=c, p=p: results.append(c.convert_batch(p)))
+               for c, p in zip(converters, (paths[:2], paths[2:]))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(not failed for _, failed in results)
+    converted = {source: target for result, _ in results for source, target in result.items()}
+    assert sorted(converted) == sorted(paths)
+    for source, target in converted.items():
+        assert open(target, 'rb').read() == open(source, 'rb').read()
+
+    profiles = log.read_text().split()
+    assert len(profiles) == 4 and len(set(profiles)) == 4
+    for profile in profiles:
+        assert profile.startswith("-env:UserInstallation=file:///")
+        assert " " not in profile and "%20" in profile
+
+
+def test_batch_starts_soffice_once_per_worker_and_reports_failures_per_file(tmp_path, fake_soffice):
+    soffice, log = fake_soffice
+
+    paths = []
+    for idx in range(6):
+        path = tmp_path / f"deck_{idx}.ppt"
+        path.write_bytes(b"bad" if idx == 3 else b"ppt %d" % idx)
+        paths.append(str(path))
+    pptx = tmp_path / "already.pptx"
+    pptx.write_bytes(b"pptx")
+    paths.append(str(pptx))
+
+    converter = PPTConverter(str(tmp_path / "cache"), str(soffice), workers=2)
+    converted, failed = converter.convert_batch(paths)
+
+    assert len(log.read_text().split()) == 2
+    assert list(failed) == [paths[3]]
+    assert sorted(converted) == sorted(paths[:3] + paths[4:])
+    assert converted[str(pptx)] == str(pptx)
+
+    # 캐시된 파일은 soffice 없이 바로 반환
+    converted, failed = converter.convert_batch(paths[:3])
+    assert len(converted) == 3 and not failed
+    assert len(log.read_text().split()) == 2
+
+
+# 자식 프로세스를 남기고 멈춰 있는 가짜 soffice (soffice -> soffice.bin 구조 흉내)
+HANGING_SOFFICE = """#!{python}
+import subprocess, sys, time
+child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])
+with open({pid_file!r}, 'w') as f:
+    f.write(str(child.pid))
+time.sleep(60)
+"""
+
+
+def test_timeout_kills_the_whole_soffice_process_group(tmp_path):
+    pid_file = tmp_path / "child.pid"
+    soffice = tmp_path / "soffice"
+    soffice.write_text(HANGING_SOFFICE.format(python=sys.executable, pid_file=str(pid_file)))
+    soffice.chmod(soffice.stat().st_mode | stat.S_IEXEC)
+
+    deck = tmp_path / "deck.ppt"
+    deck.write_bytes(b"ppt")
+    converter = PPTConverter(str(tmp_path / "cache"), str(soffice), workers=1, timeout=1)
+    with pytest.raises(ConversionError):
+        converter.ensure_pptx(str(deck))
+
+    child_pid = int(pid_file.read_text())
+    with pytest.raises(ProcessLookupError):
+        for _ in range(50):
+            os.kill(child_pid, 0)
+            time.sleep(0.1)
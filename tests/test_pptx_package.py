@@ -0,0 +1,99 @@
+import zlib
+import struct
+import zipfile
+
+import pytest
+
+from pptx_package import MappedPackage, PackageError, STORED, DEFLATED
+
+PARTS = [
+    ("ppt/slides/slide1.xml", b"<p:sld>" + b"data-omni=\"a\" " * 200 + b"</p:sld>", DEFLATED),
+    ("ppt/media/image1.png", bytes(range(256)) * 4, STORED),
+    ("docProps/한글.xml", "<x>한글</x>".encode('utf-8'), DEFLATED),
+]
+
+
+def zip64_archive(parts, eocd_fields=('count', 'cd_size', 'cd_offset')):
+    #중앙 디렉터리/EOCD의 크기·위치 필드를 0xFFFF.. 로 두고 zip64 레코드에 실제 값을 쓰는 아카이브
+    #eocd_fields: EOCD에서 zip64로 넘길 필드#
+    body = bytearray()
+    central = bytearray()
+    for name, data, method in parts:
+        raw_name = name.encode('utf-8')
+        payload = data
+        if method == DEFLATED:
+            compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+            payload = compressor.compress(data) + compressor.flush()
+        crc = zlib.crc32(data)
+        offset = len(body)
+        local_extra = struct.pack('<HHQQ', 0x0001, 16, len(data), len(payload))
+        body += struct.pack('<IHHHHHIIIHH', 0x04034b50, 45, 0x800, method, 0, 0x21, crc,
+                            0xFFFFFFFF, 0xFFFFFFFF, len(raw_name), len(local_extra))
+        body += raw_name + local_extra + payload
+
+        extra = struct.pack('<HHQQQ', 0x0001, 24, len(data), len(payload), offset)
+        central += struct.pack('<IHHHHHHIIIHHHHHII', 0x02014b50, 45, 45, 0x800, method, 0, 0x21, crc,
+                               0xFFFFFFFF, 0xFFFFFFFF, len(raw_name), len(extra), 0, 0, 0, 0, 0xFFFFFFFF)
+        central += raw_name + extra
+
+    cd_offset = len(body)
+    body += central
+    zip64_eocd = len(body)
+    body += struct.pack('<IQHHIIQQQQ', 0x06064b50, 44, 45, 45, 0, 0,
+                        len(parts), len(parts), len(central), cd_offset)
+    body += struct.pack('<IIQI', 0x07064b50, 0, zip64_eocd, 1)
+    count = 0xFFFF if 'count' in eocd_fields else len(parts)
+    cd_size = 0xFFFFFFFF if 'cd_size' in eocd_fields else len(central)
+    offset = 0xFFFFFFFF if 'cd_offset' in eocd_fields else cd_offset
+    body += struct.pack('<4sHHHHIIH', b'PK\x05\x06', 0, 0, count, count, cd_size, offset, 0)
+    return bytes(body)
+
+
+def assert_same_as_zipfile(path, data=None):
+    with zipfile.ZipFile(path) as zf, MappedPackage(path, data) as package:
+        assert sorted(package.entries) == sorted(zf.namelist())
+        for info in zf.infolist():
+            entry = package.entries[info.filename]
+            assert (entry.size, entry.compressed_size) == (info.file_size, info.compress_size)
+            assert bytes(package.read(info.filename)) == zf.read(info.filename)
+
+
+def test_sample_deck_matches_zipfile(sample_deck):
+    assert_same_as_zipfile(sample_deck)
+    with open(sample_deck, 'rb') as f:
+        assert_same_as_zipfile(sample_deck, f.read())
+
+
+def test_stored_parts_are_returned_without_copy(tmp_path):
+    path = tmp_path / "stored.zip"
+    with zipfile.ZipFile(path, 'w') as zf:
+        for name, data, method in PARTS:
+            zf.writestr(name, data, zipfile.ZIP_STORED if method == STORED else zipfile.ZIP_DEFLATED)
+
+    assert_same_as_zipfile(str(path))
+    with MappedPackage(str(path)) as package:
+        part = package.read("ppt/media/image1.png")
+        assert isinstance(part, memoryview)
+        part.release()
+
+
+@pytest.mark.parametrize("eocd_fields", [
+    ('count', 'cd_size', 'cd_offset'),
+    ('cd_offset',),
+    ('cd_size',),
+    ('count',),
+])
+def test_zip64_archive_matches_zipfile(tmp_path, eocd_fields):
+    path = tmp_path / "zip64.pptx"
+    path.write_bytes(zip64_archive(PARTS, eocd_fields))
+    assert_same_as_zipfile(str(path))
+
+
+def test_truncated_archive_is_rejected(tmp_path, sample_deck):
+    data = open(sample_deck, 'rb').read()
+    eocd = data.rfind(b'PK\x05\x06')
+    path = tmp_path / "truncated.pptx"
+    # 중앙 디렉터리 앞부분을 잘라내고 EOCD는 유지
+    path.write_bytes(data[:eocd - 200] + data[eocd:])
+    with pytest.raises(PackageError):
+        MappedPackage(str(path))
@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("pptx")
+
+from pptx import Presentation
+
+from extraction_engine import ExtractionEngine
+from progress_tracker import ProgressTracker, presentation_weights, format_eta
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_sample_weights_follow_tagging_rows(sample_deck):
+    engine = ExtractionEngine()
+    weights = presentation_weights(Presentation(sample_deck), engine.may_match)
+    # 표지/목차 슬라이드는 기본 비용만, 태깅 테이블 슬라이드는 1 + 행 수
+    assert weights == [1, 1, 23, 21, 1]
+
+
+def test_progress_is_weighted_and_throttled():
+    clock = FakeClock()
+    values, etas = [], []
+    tracker = ProgressTracker([1, 1, 23, 21, 1], values.append, etas.append, interval=0.1, clock=clock)
+
+    for idx, seconds in enumerate([0.01, 0.01, 1.0, 0.02, 0.5]):
+        clock.now += seconds
+        tracker.advance(idx)
+
+    # 직전 전달 후 0.1초 안의 갱신(슬라이드 2, 4)은 건너뛰고, 마지막(90)은 항상 전달
+    assert values == [1, 47, 90]
+    assert etas[0] == pytest.approx((47 - 25) * 1.02 / 25)
+    assert etas[-1] == 0
+
+
+def test_format_eta():
+    assert format_eta(4.6) == "5초"
+    assert format_eta(125) == "2분 5초"
+    assert format_eta(3720) == "1시간 2분"
@@ -0,0 +1,133 @@
+import copy
+import os
+import time
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("pptx")
+
+from pptx import Presentation
+
+from ppttoexcel2 import PPTDataExtractor
+
+# 샘플 태깅 가이드 기준 회귀 테스트
+# - 골든 출력과 레코드가 정확히 같아야 함
+# - 1,000행당 시간/메모리 예산 (PERF_TOLERANCE 환경 변수로 배율 조정)
+
+PERF_TOLERANCE = float(os.environ.get("PERF_TOLERANCE", "1.0"))
+
+# 1,000 레코드당 예산 (초, MB) - 측정값의 약 2~3배
+EXTRACT_SECONDS_PER_1K = 1.5
+EXTRACT_PEAK_MB_PER_1K = 2.0
+SAVE_SECONDS_PER_1K = 1.0
+SAVE_PEAK_MB_PER_1K = 8.0
+
+# 샘플 덱 1벌 = 13행 -> 1,300행 / 5,200행 (고정 비용이 예산을 가리지 않는 크기)
+SCALE_FACTORS = [100, 400]
+
+
+def make_extractor(tmp_path, name="deck.pptx"):
+    extractor = PPTDataExtractor(str(tmp_path / name), None, isolated=False)
+    extractor.excel_output_path = str(tmp_path / "output_tagging.xlsx")
+    return extractor
+
+
+def extract_all(extractor, presentation):
+    records = extractor.extract_table_data(presentation)
+    records.extend(extractor.extract_deep_data(presentation))
+    return records
+
+
+def scaled_deck(sample_deck, path, factor):
+    #태깅 테이블이 있는 슬라이드를 factor번 복제한 덱#
+    presentation = Presentation(sample_deck)
+    originals = list(presentation.slides)
+    for _ in range(factor - 1):
+        for source in originals:
+            slide = presentation.slides.add_slide(source.slide_layout)
+            for shape in list(slide.shapes):
+                shape._element.getparent().remove(shape._element)
+            for element in source.shapes._spTree.iterchildren():
+                if element.tag.endswith('}nvGrpSpPr') or element.tag.endswith('}grpSpPr'):
+                    continue
+                slide.shapes._spTree.append(copy.deepcopy(element))
+    presentation.save(path)
+    return path
+
+
+def measure(func):
+    #(결과, 소요 시간, 최대 할당 MB) - tracemalloc이 시간을 늘리므로 시간은 따로 측정#
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak / (1024 * 1024)
+
+
+def assert_budget(label, rows, seconds, peak_mb, seconds_per_1k, peak_mb_per_1k):
+    units = rows / 1000
+    seconds_budget = seconds_per_1k * units * PERF_TOLERANCE
+    peak_budget = peak_mb_per_1k * units * PERF_TOLERANCE
+    assert seconds <= seconds_budget, f"{label}: {seconds:.3f}s > 예산 {seconds_budget:.3f}s ({rows}행)"
+    assert peak_mb <= peak_budget, f"{label}: 최대 {peak_mb:.1f}MB > 예산 {peak_budget:.1f}MB ({rows}행)"
+
+
+def test_sample_deck_matches_golden(tmp_path, sample_deck, golden):
+    extractor = make_extractor(tmp_path)
+    records = extract_all(extractor, Presentation(sample_deck))
+    assert records == golden
+
+
+def test_save_to_excel_writes_golden_rows(tmp_path, golden):
+    from openpyxl import load_workbook
+
+    extractor = make_extractor(tmp_path)
+    extractor.save_to_excel(golden)
+
+    sheet = load_workbook(extractor.excel_output_path)['태깅 데이터']
+    headers = [cell.value for cell in sheet[5][3:12]]
+    assert headers == ['No', 'Slide', 'Title', 'Action', 'data-omni-type', 'data-omni', 'ga-ca', 'ga-ac', 'ga-la']
+
+    rows = list(sheet.iter_rows(min_row=6, min_col=4, max_col=12, values_only=True))
+    assert len(rows) == len(golden)
+    for row, record in zip(rows, golden):
+        assert list(row) == [record.get(header) or None for header in headers]
+
+
+@pytest.mark.parametrize("factor", SCALE_FACTORS)
+def test_scaled_extraction_budget(tmp_path, sample_deck, golden, factor):
+    deck = scaled_deck(sample_deck, str(tmp_path / f"scaled_{factor}.pptx"), factor)
+    presentation = Presentation(deck)
+    extractor = make_extractor(tmp_path)
+
+    records, seconds, peak_mb = measure(lambda: extract_all(extractor, presentation))
+
+    # 복제한 슬라이드 번호만 다르고 내용은 골든과 같아야 함
+    slides_per_copy = len(presentation.slides) // factor
+    assert len(records) == len(golden) * factor
+    for copy_idx in range(factor):
+        chunk = records[copy_idx * len(golden):(copy_idx + 1) * len(golden)]
+        expected = [dict(record, Slide=record['Slide'] + copy_idx * slides_per_copy) for record in golden]
+        assert chunk == expected
+
+    assert_budget("extract_table_data", len(records), seconds, peak_mb,
+                  EXTRACT_SECONDS_PER_1K, EXTRACT_PEAK_MB_PER_1K)
+
+
+@pytest.mark.parametrize("rows", [2000, 10000])
+def test_save_to_excel_budget(tmp_path, golden, rows):
+    records = [dict(golden[idx % len(golden)], Slide=idx // len(golden) + 1) for idx in range(rows)]
+    extractor = make_extractor(tmp_path)
+
+    _, seconds, peak_mb = measure(lambda: extractor.save_to_excel(records))
+
+    assert os.path.exists(extractor.excel_output_path)
+    assert_budget("save_to_excel", rows, seconds, peak_mb, SAVE_SECONDS_PER_1K, SAVE_PEAK_MB_PER_1K)
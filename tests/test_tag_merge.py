@@ -0,0 +1,63 @@
+from openpyxl import load_workbook
+
+from tag_merge import TagMerger, merged_headers
+
+
+def make_records(count, tags):
+    return [
+        {'Slide': idx // 10 + 1, 'No': idx % 10, 'data-omni': f"a{idx % tags}", 'ga-ca': "cat"}
+        for idx in range(count)
+    ]
+
+
+def merged_rows(records, max_memory_rows, tmp_path):
+    with TagMerger(str(tmp_path), max_memory_rows=max_memory_rows, partitions=4) as merger:
+        merger.add_records("deck_a.pptx", records)
+        merger.add_records("deck_b.pptx", records[:10])
+        rows = list(merger.iter_rows())
+        return rows, merger.spilled
+
+
+def test_spilled_merge_matches_in_memory(tmp_path):
+    records = make_records(3000, 50)
+    in_memory, spilled = merged_rows(records, 1000000, tmp_path)
+    assert not spilled
+    on_disk, spilled = merged_rows(records, 100, tmp_path)
+    assert spilled
+
+    # 내보낸 뒤에도 처음 나온 순서 그대로
+    assert on_disk == in_memory
+    assert [row[1] for row in on_disk] == [f"a{idx}" for idx in range(50)]
+    counts = {row[1]: row[5] for row in in_memory}
+    assert counts['a1'] == 61
+    assert sum(counts.values()) == 3010
+
+
+def test_sources_are_capped_per_tag(tmp_path):
+    records = make_records(500, 1)
+    for max_memory_rows in (1000000, 50):
+        with TagMerger(str(tmp_path), max_memory_rows=max_memory_rows, partitions=4, max_sources=10) as merger:
+            merger.add_records("deck_a.pptx", records)
+            [row] = list(merger.iter_rows())
+        sources = row[7].split("; ")
+        assert row[5:7] == [500, 1]
+        assert sources[0] == "deck_a.pptx#1#0"
+        assert sources[10:] == ["... (+490)"]
+
+
+def test_merged_output_sharded_by_category(tmp_path):
+    records = make_records(200, 10)
+    for idx, record in enumerate(records):
+        record['ga-ca'] = f"cat {idx % 3}"
+
+    output = tmp_path / "merged.xlsx"
+    with TagMerger(str(tmp_path)) as merger:
+        merger.add_records("deck_a.pptx", records)
+        count = merger.write_shards(str(output))
+
+    wb = load_workbook(output)
+    assert wb.sheetnames == ['Index', 'cat 0', 'cat 1', 'cat 2']
+    index = list(wb['Index'].iter_rows(min_row=2, values_only=True))
+    assert sum(row[2] for row in index) == count
+    headers = [cell.value for cell in wb['cat 0'][1]]
+    assert headers == merged_headers()
@@ -0,0 +1,47 @@
+import os
+import sys
+import subprocess
+
+from tag_schema import TagSchema, default_schema
+
+
+def test_default_schema_matches_output_headers():
+    schema = default_schema()
+    assert schema.output_columns == ['No', 'Slide', 'Title', 'Action',
+                                     'data-omni-type', 'data-omni', 'ga-ca', 'ga-ac', 'ga-la']
+
+
+def test_first_value_per_attribute():
+    text = '“Buy now” data-omni = “shop:buy” ga-la="shop:buy" data-omni-type="microsite" ga-la="second"'
+    assert default_schema().extract_attributes(text) == {
+        'data-omni-type': 'microsite', 'data-omni': 'shop:buy', 'ga-la': 'shop:buy'}
+
+
+def test_overlapping_value_matches_per_attribute_search():
+    # 값 안에 다른 속성 형식이 들어 있어도 속성별로 따로 검색한 결과와 같아야 함
+    text = 'ga-la="foo ga-ca="bar"'
+    assert default_schema().extract_attributes(text) == {'ga-ca': 'bar', 'ga-la': 'foo ga-ca='}
+
+
+def test_new_tag_family_from_schema():
+    schema = TagSchema.from_dict({
+        'attributes': ['data-omni', 'an-event', 'an-label'],
+        'exclude_tags': ['an-'],
+        'action_keywords': ['tap']
+    })
+    text = 'Tap banner an-event="banner_click" an-label="kv" data-omni="kv:banner"'
+    assert schema.extract_attributes(text) == {
+        'data-omni': 'kv:banner', 'an-event': 'banner_click', 'an-label': 'kv'}
+    assert schema.is_action('Tap')
+    assert not schema.is_action('an-event="x"')
+
+
+def test_bad_schema_does_not_break_imports(repo_root):
+    # 스키마는 처음 쓸 때 로드 - 잘못된 TAGGING_SCHEMA는 import가 아니라 사용 시점에 SchemaError
+    env = dict(os.environ, TAGGING_SCHEMA=os.path.join(repo_root, 'nonexistent.json'))
+    code = ("import deep_scanner, tag_merge, tag_shards, tag_validator, extraction_bench\n"
+            "from tag_schema import default_schema, SchemaError\n"
+            "try:\n    default_schema()\nexcept SchemaError:\n    print('schema error')\n")
+    result = subprocess.run([sys.executable, '-c', code], cwd=repo_root, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == 'schema error'
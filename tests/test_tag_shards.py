@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from openpyxl import load_workbook
+
+from tag_shards import (shard_records, spill_shards, sheet_title, write_shards, write_shard_stream,
+                        output_columns, NO_CATEGORY)
+
+
+def scaled_records(golden, copies):
+    return [dict(record, Slide=record['Slide'] + 10 * copy) for copy in range(copies) for record in golden]
+
+
+def test_shard_by_slide_range(golden):
+    shards = shard_records(scaled_records(golden, 3), 'slide', slides_per_shard=10)
+    assert [shard.label for shard in shards] == ["슬라이드 1-10", "슬라이드 11-20", "슬라이드 21-30"]
+    assert [shard.slide_range for shard in shards] == ["3-4", "13-14", "23-24"]
+    assert all(len(shard.records) == 13 for shard in shards)
+
+
+def test_shard_by_category_and_row_limit(golden):
+    records = scaled_records(golden, 2)
+    shards = shard_records(records, 'ga-ca', max_rows=4)
+    labels = [shard.label for shard in shards]
+    assert NO_CATEGORY in labels
+    assert "content click (1)" in labels and "content click (2)" in labels
+    assert sum(len(shard.records) for shard in shards) == len(records)
+    assert all(len(shard.records) <= 4 for shard in shards)
+
+
+@pytest.mark.parametrize("by", ['slide', 'ga-ca'])
+def test_spilled_shards_match_in_memory(tmp_path, by, golden):
+    records = scaled_records(golden, 3)
+    expected = shard_records(records, by, slides_per_shard=10, max_rows=4)
+    spilled = spill_shards(iter(records), str(tmp_path), by, slides_per_shard=10, max_rows=4)
+    assert [shard.label for shard in spilled] == [shard.label for shard in expected]
+    assert [shard.slide_range for shard in spilled] == [shard.slide_range for shard in expected]
+    assert [list(shard.records) for shard in spilled] == [shard.records for shard in expected]
+
+
+def test_stream_writes_same_workbook_and_cleans_up(tmp_path, golden):
+    records = scaled_records(golden, 2)
+    columns = output_columns(records)
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+    listed = write_shards(str(tmp_path / "listed.xlsx"), records, 'ga-ca', 'files', workers=2)
+    streamed = write_shard_stream(str(tmp_path / "streamed.xlsx"), iter(records), columns, 'ga-ca', 'files',
+                                  workers=2, spill_dir=str(spill_dir))
+
+    assert [(shard.label, len(shard.records)) for shard in streamed] == \
+        [(shard.label, len(shard.records)) for shard in listed]
+    for mine, theirs in zip(streamed, listed):
+        rows = list(load_workbook(mine.path)[mine.title].iter_rows(values_only=True))
+        assert rows == list(load_workbook(theirs.path)[theirs.title].iter_rows(values_only=True))
+    assert list(spill_dir.iterdir()) == []
+
+
+def test_sheet_title_rules():
+    used = set()
+    assert sheet_title("a/b:c", used) == "a_b_c"
+    assert sheet_title("a/b:c", used) == "a_b_c (2)"
+    assert sheet_title("Index", used) == "Index (2)"
+    assert len(sheet_title("x" * 40, used)) == 31
+
+
+def test_write_sheets_with_index_links(tmp_path, golden):
+    path = str(tmp_path / "sharded.xlsx")
+    shards = write_shards(path, scaled_records(golden, 3), 'slide', 'sheets', slides_per_shard=10)
+
+    wb = load_workbook(path)
+    assert wb.sheetnames == ['Index'] + [shard.title for shard in shards]
+    index = wb['Index']
+    for row, shard in enumerate(shards, start=2):
+        assert index.cell(row, 3).value == 13
+        assert index.cell(row, 4).hyperlink.location == f"'{shard.title}'!A1"
+        assert wb[shard.title].max_row == 14
+
+
+def test_write_files_in_parallel(tmp_path, golden):
+    path = str(tmp_path / "sharded.xlsx")
+    records = scaled_records(golden, 2)
+    shards = write_shards(path, records, 'ga-ca', 'files', workers=2)
+
+    index = load_workbook(path)['Index']
+    total = 0
+    for row, shard in enumerate(shards, start=2):
+        assert os.path.exists(shard.path)
+        assert index.cell(row, 4).hyperlink.target == f"sharded_shards/{os.path.basename(shard.path)}"
+        total += len(list(load_workbook(shard.path)[shard.title].iter_rows(min_row=2)))
+    assert total == len(records)
+
+
+def test_slides_per_shard_must_be_positive(golden):
+    from tag_shards import main
+
+    with pytest.raises(ValueError):
+        shard_records(golden, 'slide', slides_per_shard=0)
+    with pytest.raises(SystemExit):
+        main(["deck.pptx", "-o", "out.xlsx", "--slides-per-shard", "0"])
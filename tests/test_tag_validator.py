@@ -0,0 +1,106 @@
+import json
+
+from openpyxl import load_workbook
+
+from tag_validator import validate_records, build_report, VALIDATION_HEADERS, ISSUE_COLUMNS
+from tag_workbook import write_tagging_workbook, report_path_for, START_ROW, START_COL
+
+
+def tag(slide, no, **attributes):
+    record = {'Slide': slide, 'No': no, 'Title': f"Slide {slide}", 'Action': 'Click'}
+    record.update({key.replace('_', '-'): value for key, value in attributes.items()})
+    return record
+
+
+def full(slide, no, omni, ga_ca='cta', ga_ac='click', ga_la=None):
+    return tag(slide, no, data_omni=omni, ga_ca=ga_ca, ga_ac=ga_ac, ga_la=ga_la or omni.split('|')[0])
+
+
+RECORDS = [
+    # 1. 정상 (제품 코드가 붙은 data-omni, ga-la는 코드 앞부분과 같음)
+    tag(1, 1, data_omni_type='microsite', data_omni='features:buy|;SM-G991,SM-G996',
+        ga_ca='content click', ga_ac='feature', ga_la='features:buy'),
+    # 2~5. 명명 규칙 - 속성마다 한 건씩
+    full(2, 1, 'Home:KV', ga_la='home:kv'),
+    full(2, 2, 'home:cta', ga_ca=' kv'),
+    full(2, 3, 'home:menu', ga_ac='Click!'),
+    full(2, 4, 'home:faq', ga_la='home/faq'),
+    # 6. data-omni 없이 data-omni-type만
+    tag(3, 1, data_omni_type='microsite'),
+    # 7~8. 같은 슬라이드의 다른 No에서 같은 값
+    full(4, 1, 'buy'),
+    full(4, 2, 'buy'),
+    # 9~10. 다른 슬라이드이거나 같은 No면 중복 아님
+    full(5, 1, 'buy'),
+    full(5, 1, 'buy'),
+    # 11. GA 속성 누락
+    tag(6, 1, data_omni='cart'),
+    # 12. ga-la 불일치만
+    full(6, 2, 'cart:add|;SKU1', ga_la='cart:remove'),
+]
+
+EXPECTED_ISSUES = [
+    (2, 2, 1, 'error', 'naming', 'data-omni', 'Home:KV'),
+    (2, 2, 1, 'warning', 'ga-la-mismatch', 'ga-la', 'home:kv'),
+    (3, 2, 2, 'error', 'naming', 'ga-ca', ' kv'),
+    (4, 2, 3, 'error', 'naming', 'ga-ac', 'Click!'),
+    (5, 2, 4, 'error', 'naming', 'ga-la', 'home/faq'),
+    (5, 2, 4, 'warning', 'ga-la-mismatch', 'ga-la', 'home/faq'),
+    (6, 3, 1, 'error', 'type-without-omni', 'data-omni-type', 'microsite'),
+    (7, 4, 1, 'error', 'duplicate', 'data-omni', 'buy'),
+    (7, 4, 1, 'error', 'duplicate', 'ga-la', 'buy'),
+    (8, 4, 2, 'error', 'duplicate', 'data-omni', 'buy'),
+    (8, 4, 2, 'error', 'duplicate', 'ga-la', 'buy'),
+    (11, 6, 1, 'warning', 'missing-ga', 'ga-ca', ''),
+    (11, 6, 1, 'warning', 'missing-ga', 'ga-ac', ''),
+    (11, 6, 1, 'warning', 'missing-ga', 'ga-la', ''),
+    (12, 6, 2, 'warning', 'ga-la-mismatch', 'ga-la', 'cart:remove'),
+]
+
+EXPECTED_COUNTS = {
+    'total_records': 12,
+    'error_count': 9,
+    'warning_count': 6,
+    'by_rule': {'naming': 4, 'duplicate': 4, 'missing-ga': 3, 'ga-la-mismatch': 3, 'type-without-omni': 1},
+}
+
+
+def issue_rows(issues):
+    return [tuple(row[:7]) for row in issues[ISSUE_COLUMNS].itertuples(index=False, name=None)]
+
+
+def test_rules():
+    assert issue_rows(validate_records(RECORDS)) == EXPECTED_ISSUES
+
+
+def test_valid_and_empty_records():
+    assert validate_records(RECORDS[:1]).empty
+    assert list(validate_records([]).columns) == ISSUE_COLUMNS
+
+
+def test_build_report():
+    report = build_report(validate_records(RECORDS), len(RECORDS))
+    assert {key: report[key] for key in EXPECTED_COUNTS} == EXPECTED_COUNTS
+    assert [tuple(issue[column] for column in ISSUE_COLUMNS[:7]) for issue in report['issues']] == EXPECTED_ISSUES
+
+
+def test_workbook_validation_sheet_and_json(tmp_path):
+    path = str(tmp_path / 'deck_tagging.xlsx')
+    report = write_tagging_workbook(path, RECORDS)
+
+    wb = load_workbook(path)
+    assert wb.sheetnames == ['태깅 데이터', 'Validation']
+    data = wb['태깅 데이터']
+    assert data.cell(row=START_ROW + 1, column=START_COL).value == 1
+    assert data.max_row == START_ROW + len(RECORDS)
+
+    rows = list(wb['Validation'].iter_rows(values_only=True))
+    assert list(rows[0]) == VALIDATION_HEADERS
+    # 시트에는 Row 열이 없음 (마지막 열은 Message), 빈 값은 빈 셀(None)로 저장됨
+    assert [tuple('' if value is None else value for value in row[:6]) for row in rows[1:]] == \
+        [issue[1:] for issue in EXPECTED_ISSUES]
+
+    with open(report_path_for(path), encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved == report
+    assert {key: saved[key] for key in EXPECTED_COUNTS} == EXPECTED_COUNTS